@@ -11,6 +11,12 @@ from .ui_helpers import style_listbox_for_theme
 from config import appname, user_agent  # type: ignore
 import timeout_session  # type: ignore
 
+try:
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # We need a name of plugin dir, not AutoCompleter.py dir
 plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
 logger = logging.getLogger(f'{appname}.{plugin_name}')
@@ -160,7 +166,7 @@ class AutoCompleter(PlaceHolder):
                 session = timeout_session.new_session()
                 session.headers['User-Agent'] = user_agent + ' GalaxyGPS'
                 results = session.get(url, params={'q': inp}, timeout=3)
-                lista = json.loads(results.content)
+                lista = _json_loads(results.content)
                 if lista:
                     self.write(lista)
             except Exception:
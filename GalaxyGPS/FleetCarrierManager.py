@@ -49,6 +49,7 @@ class FleetCarrierManager:
         self.plugin_dir = plugin_dir
         self.carriers_file = os.path.join(plugin_dir, 'fleet_carriers.csv')
         self.carriers: Dict[str, Dict] = {}  # Keyed by callsign
+        self.version = 0  # Bumped whenever carriers are added, replaced or removed
         
         # Load existing carrier data
         self.load_carriers()
@@ -99,6 +100,7 @@ class FleetCarrierManager:
                             'source_galaxy': get_field(row, 'Source Galaxy', '')
                         }
             
+            self.version += 1
             logger.info(f"Loaded {len(self.carriers)} fleet carrier(s) from CSV")
         
         except Exception:
@@ -108,6 +110,8 @@ class FleetCarrierManager:
         """
         Save fleet carrier data to CSV file.
         """
+        # Every change to self.carriers is followed by a save
+        self.version += 1
         try:
             with open(self.carriers_file, 'w', encoding='utf-8', newline='') as csvfile:
                 writer = csv.DictWriter(csvfile, fieldnames=self.CSV_HEADERS)
@@ -516,6 +520,8 @@ class FleetCarrierManager:
                         'last_updated': event_timestamp,
                         'source_galaxy': source_galaxy
                     }
+                    # Not always followed by a save (the stats may carry nothing to update)
+                    self.version += 1
                 
                 # Check timestamp before updating existing carrier
                 if callsign in self.carriers:
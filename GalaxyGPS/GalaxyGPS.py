@@ -1,4 +1,5 @@
 import csv
+import itertools
 import json
 import logging
 import math
@@ -14,16 +15,30 @@ import tkinter.ttk as ttk
 import traceback
 import urllib.parse
 import webbrowser
-from time import sleep
+from collections import Counter
+from collections.abc import Mapping
+from operator import itemgetter
+from pathlib import Path
+from time import monotonic, sleep
 from tkinter import *
 
 import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+from urllib3.util.retry import Retry  # type: ignore
 from config import appname, config, user_agent  # type: ignore
 import timeout_session  # type: ignore
 from monitor import monitor  # type: ignore
+import plug  # type: ignore
 from ttkHyperlinkLabel import HyperlinkLabel  # type: ignore
 from theme import theme  # type: ignore
 
+try:
+    # Faster parsing of large Spansh route responses when available; orjson errors subclass ValueError
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Localization: use plugin's tl from package (PLUGINS.md: avoid "from load import" across plugins)
 from GalaxyGPS import _plugin_tl as plugin_tl  # type: ignore
 
@@ -38,11 +53,147 @@ from .ui.message_dialog import showinfo, showwarning, showerror, askyesno
 plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
 logger = logging.getLogger(f'{appname}.{plugin_name}')
 
+# Matches values already in "N.NN" form (no sign or leading zeros), which need no rounding
+_TWO_DP = re.compile(r'(?:0|[1-9][0-9]*)\.[0-9]{2}').fullmatch
+
+# How long a plotted Spansh route is reused for an identical request, in seconds
+SPANSH_ROUTE_CACHE_TTL = 600
+# Spansh result polling: first retry delay, backoff cap and overall deadline (seconds)
+SPANSH_POLL_INITIAL_DELAY = 0.25
+SPANSH_POLL_MAX_DELAY = 2.0
+SPANSH_POLL_TIMEOUT = 60
+# Result statuses that mean "ask again": job still running (202) or Spansh briefly unavailable
+SPANSH_POLL_AGAIN_STATUSES = frozenset((202, 503, 504))
+# Phrases in a Spansh 400 error that identify the bad source / destination system
+SPANSH_ERR_SOURCE = "starting system"
+SPANSH_ERR_DEST = "finishing system"
+# Virtual events workers raise on the plugin frame once their result is queued
+ROUTE_READY_EVENT = '<<GalaxyGPSRouteReady>>'
+RINGS_READY_EVENT = '<<GalaxyGPSRingsReady>>'
+CSV_READY_EVENT = '<<GalaxyGPSCsvReady>>'
+# Display refreshes requested within this window (ms) of each other are run once
+DISPLAY_REFRESH_DELAY_MS = 50
+
+# Route CSV column headers; the *_header attributes are set from these
+SYSTEM_HEADER = "System Name"
+BODYNAME_HEADER = "Body Name"
+BODYSUBTYPE_HEADER = "Body Subtype"
+JUMPS_HEADER = "Jumps"
+RESTOCKTRITIUM_HEADER = "Restock Tritium"
+REFUEL_HEADER = "Refuel"
+# Lowercase forms, lowered once, for matching route CSV headers case-insensitively
+_LC_SYSTEM = SYSTEM_HEADER.lower()
+_LC_BODYNAME = BODYNAME_HEADER.lower()
+_LC_BODYSUBTYPE = BODYSUBTYPE_HEADER.lower()
+_LC_JUMPS = JUMPS_HEADER.lower()
+_LC_RESTOCKTRITIUM = RESTOCKTRITIUM_HEADER.lower()
+_LC_REFUEL = REFUEL_HEADER.lower()
+
+# Road to Riches body subtype (lowercase) -> bucket in update_bodies_text; anything else is bucket 4 (Unknown)
+_SUBTYPE_BUCKET = {
+    "high metal content world": 0,
+    "rocky body": 1,
+    "earth-like world": 2,
+    "water world": 3,
+}
+
+# Jump count on an EDTS route line ("=== ... 12 jumps ...")
+_EDTS_JUMPS_RE = re.compile(r"(\d+) jump")
+
+# Stored icy_rings / pristine values that mean the rings lookup has already been done
+_YES_NO = frozenset(('yes', 'no'))
+
+# Carrier callsign in a dropdown option ("Name (XXX-XXX) | System | ...")
+_CALLSIGN_RE = re.compile(r'\(([A-Z0-9]+-[A-Z0-9]+)\)')
+
+# Inara / EDSM page templates, filled with a _quote()d name or system
+_INARA_STATION_TMPL = "https://inara.cz/elite/station/?search={}"
+_INARA_SYSTEM_TMPL = "https://inara.cz/elite/starsystem/?search={}"
+_EDSM_SYSTEM_TMPL = "https://www.edsm.net/en/system?systemName={}"
+_INARA_TRITIUM_TMPL = "https://inara.cz/elite/commodities/?pi2=10269&ps1={}"
+_EDSM_BODIES_TMPL = "https://www.edsm.net/api-system-v1/bodies?systemName={}"
+_quote = urllib.parse.quote
+
+# Matches integer cells that int() always accepts
+_INT_CELL = re.compile(r'\s*[+-]?[0-9]+\s*').fullmatch
+
+
+def _remove_file(path):
+    """Delete a plugin state file; a missing file is not an error."""
+    try:
+        Path(path).unlink(missing_ok=True)
+    except OSError:
+        logger.debug(f"Could not delete {path}")
+
+
+def _extract_callsign(text):
+    """
+    Return the callsign from a dropdown option ("Name (XXX-XXX) | System | ..."), or None.
+    Same result as _CALLSIGN_RE; the usual case, where the first parentheses hold the
+    callsign, is checked with plain string methods.
+    """
+    start = text.find('(')
+    if start < 0:
+        return None
+    end = text.find(')', start + 1)
+    if end > start:
+        left, sep, right = text[start + 1:end].partition('-')
+        token = left + right
+        if sep and left and right and token.isascii() and token.isalnum() and token.upper() == token:
+            return text[start + 1:end]
+    match = _CALLSIGN_RE.search(text, start)
+    return match.group(1) if match else None
+
+
+def _most_recent_carrier(carriers):
+    """Return the carrier with the latest 'last_updated' (first one on ties), or None."""
+    return max(carriers, key=lambda x: str(x.get('last_updated', '')), default=None)
+
+
+def _set_widget_state(widget, state):
+    """Set a Tk widget's state, skipping the configure call if it already has it."""
+    if widget and str(widget.cget('state')) != state:
+        widget.config(state=state)
+
+
+def _carrier_option_text(carrier):
+    """Dropdown text for a carrier: "Name (CALLSIGN) | System | Tritium: N"."""
+    name = carrier.get('name', '')
+    callsign = carrier.get('callsign', 'Unknown')
+    display_name = f"{name} ({callsign})" if name else callsign
+    system = carrier.get('current_system', 'Unknown')
+    fuel = carrier.get('fuel', '0')
+    return f"{display_name} | {system} | Tritium: {fuel}"
+
+
+def _sum_jumps(cells):
+    """Sum the jump counts in a CSV column, treating blank or non-integer cells as 0."""
+    return sum(int(cell) for cell in cells if cell and _INT_CELL(cell))
+
+
+def _parse_int(value):
+    """Return value as an int, or None if int() would reject it; plain digit strings skip the exception path."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        return int(value) if _INT_CELL(value) else None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
 
 def _round_distance(val):
-    """Round distance value up to nearest hundredth. Used by Spansh route worker."""
+    """Round distance value up to nearest hundredth. Used by Spansh route worker and CSV import."""
     if not val or val == "":
         return ""
+    if isinstance(val, str) and _TWO_DP(val):
+        return val
+    if isinstance(val, str) and val.isascii() and val.replace('.', '', 1).isdigit():
+        # Plain decimal with at most 2 places is already rounded, only pad it to 2 places
+        whole, _, frac = val.partition('.')
+        if len(frac) <= 2:
+            return f"{whole.lstrip('0') or '0'}.{frac:0<2}"
     try:
         val_float = float(val)
         return f"{math.ceil(val_float * 100) / 100:.2f}"
@@ -50,6 +201,35 @@ def _round_distance(val):
         return str(val) if val is not None else ""
 
 
+class _RouteRow(Mapping):
+    """Read-only view of one imported CSV row, keyed by lowercase column name.
+
+    Rows of one route share a single name -> index map, so each row keeps only
+    the list produced by the CSV reader instead of a dict with its own keys.
+    """
+    __slots__ = ('_values', '_index')
+
+    def __init__(self, values, index):
+        self._values = values
+        self._index = index
+
+    def __getitem__(self, key):
+        return self._values[self._index[key]]
+
+    def get(self, key, default=None):
+        i = self._index.get(key)
+        return default if i is None else self._values[i]
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+
 class GalaxyGPS():
     def __init__(self, plugin_dir):
         version_file = os.path.join(plugin_dir, "version.json")
@@ -93,18 +273,25 @@ class GalaxyGPS():
         self.save_route_path = os.path.join(plugin_dir, 'route.csv')
         self.export_route_path = os.path.join(plugin_dir, 'Export for TCE.exp')
         self.offset_file_path = os.path.join(plugin_dir, 'offset')
+        # Per-system EDSM rings lookups: lowercase system name -> [has_icy_rings, has_pristine]
+        self.edsm_rings_cache_path = os.path.join(plugin_dir, 'edsm_rings_cache.json')
+        self._edsm_rings_cache = None  # Loaded on first lookup
+        self._edsm_rings_lock = threading.Lock()
         self.original_csv_path = None  # Store path to original CSV file to preserve all columns
         self.offset = 0
         self.jumps_left = 0
+        self._jumps_prefix = []  # Cumulative jumps per route row, rebuilt when a route is loaded
+        self._system_body_counts = Counter()  # Lowercase system name -> route rows, rebuilt with _jumps_prefix
+        self._last_btn_text = ''  # Last text written to the waypoint button
         self.error_txt = tk.StringVar()
         # LANG: Error message when route plotting fails
         self.plot_error = plugin_tl("Error while trying to plot a route, please try again.")
-        self.system_header = "System Name"
-        self.bodyname_header = "Body Name"
-        self.bodysubtype_header = "Body Subtype"
-        self.jumps_header = "Jumps"
-        self.restocktritium_header = "Restock Tritium"
-        self.refuel_header = "Refuel"
+        self.system_header = SYSTEM_HEADER
+        self.bodyname_header = BODYNAME_HEADER
+        self.bodysubtype_header = BODYSUBTYPE_HEADER
+        self.jumps_header = JUMPS_HEADER
+        self.restocktritium_header = RESTOCKTRITIUM_HEADER
+        self.refuel_header = REFUEL_HEADER
         self.pleaserefuel = False
         # distance tracking
         self.dist_next = ""
@@ -125,11 +312,29 @@ class GalaxyGPS():
         self.fleet_carrier_inara_btn = None
         self.fleet_carrier_system_label = None
         self.fleet_carrier_tritium_label = None
+        self._tritium_available = False  # Tritium label shows data (blue, clickable) rather than "Unknown"
         self.fleet_carrier_separator = None
         self.selected_carrier_callsign = None
+        self._callsign_to_index = {}  # Callsign -> fleet carrier dropdown position, rebuilt with the values
+        self._option_callsigns = []  # Callsign of each fleet carrier dropdown option, in the same order
+        self._last_selected_callsign = None  # Carrier the fleet carrier displays were last refreshed for
+        self._carrier_refresh_pending = False  # A _refresh_carrier_panel call is queued with after_idle
+        self._last_restock_state = None  # (offset, restock value) the Tritium restock warning was last drawn for
+        self._label_state = {}  # Label widget -> options last applied by _set_label
+        self._pending_refresh = {}  # Refresh key -> Tk after id of the queued _schedule_refresh call
         self.fleet_carrier_var = tk.StringVar()
         self._gui_initialized = False  # Track if GUI has been initialized
         self._route_queue = queue.Queue()
+        self._csv_queue = queue.Queue()
+        self._rings_queue = queue.Queue()
+        # (source, dest, efficiency, range, supercharge) -> (monotonic time, Spansh route result)
+        self._spansh_route_cache = {}
+        # Spansh HTTP session kept across plots so the submit and result polls share one connection
+        self._spansh_session = None
+        self._edsm_session = None  # Same for EDSM rings lookups
+        # Carrier list shared by all lookups until FleetCarrierManager.version changes
+        self._carriers_cache = None
+        self._carriers_cache_version = -1
 
     #   -- GUI part --
     def init_gui(self, parent):
@@ -366,6 +571,7 @@ class GalaxyGPS():
             # Route info - make waypoint button more compact with minimal internal padding
             self.waypoint_prev_btn = tk.Button(self.frame, text="↑", command=self.goto_prev_waypoint, width=3, font=("Arial", 12, "bold"), padx=0, pady=0)
             self.waypoint_btn = tk.Button(self.frame, text=self.next_wp_label + '\n' + self.next_stop, command=self.copy_waypoint, width=20, padx=2, pady=2)
+            self._last_btn_text = self.next_wp_label + '\n' + self.next_stop
             self.waypoint_next_btn = tk.Button(self.frame, text="↓", command=self.goto_next_waypoint, width=3, font=("Arial", 12, "bold"), padx=0, pady=0)
             self.jumpcounttxt_lbl = tk.Label(self.frame, text=self.jumpcountlbl_txt + str(self.jumps_left))
             self.dist_prev_lbl = tk.Label(self.frame, text="")
@@ -576,6 +782,8 @@ class GalaxyGPS():
             
             # Apply EDMC theme to the main frame and all widgets
             theme.update(self.frame)
+            # The theme may have recoloured labels, so _set_label must re-apply its colours
+            self._label_state.clear()
             
             # Now style the combobox with theme-aware colors (after theme.update() has been applied)
             # Get frame background color AFTER theme.update() to get the correct theme color
@@ -678,6 +886,8 @@ class GalaxyGPS():
         Update the fleet carrier combobox and orange label colors when EDMC theme changes.
         Called by prefs_changed() in load.py.
         """
+        # The theme may have recoloured labels, so _set_label must re-apply its colours
+        self._label_state.clear()
         # Update combobox
         if hasattr(self, 'fleet_carrier_combobox'):
             try:
@@ -1005,7 +1215,7 @@ class GalaxyGPS():
     def show_route_gui(self, show):
         """Show or hide the route navigation interface (legacy method, now uses centralized approach)"""
         self.hide_error()
-        if show and len(self.route) > 0:
+        if show and self.route:
             self._update_widget_visibility('route')
         else:
             self._update_widget_visibility('empty')
@@ -1062,6 +1272,8 @@ class GalaxyGPS():
         for widget in route_widgets + plotting_widgets + info_labels + basic_controls_container + plotting_controls_container:
             if widget not in always_visible:
                 widget.grid_remove()
+        # The restock warning was just hidden, so its next check must redraw it
+        self._last_restock_state = None
         
         # Show widgets based on state
         if state == 'plotting':
@@ -1092,7 +1304,7 @@ class GalaxyGPS():
             # Show basic controls container
             for widget in basic_controls_container:
                 widget.grid()
-        elif state == 'route' and len(self.route) > 0:
+        elif state == 'route' and self.route:
             # Hide plotting widgets and container
             for widget in plotting_widgets:
                 widget.grid_remove()
@@ -1112,6 +1324,7 @@ class GalaxyGPS():
                 try:
                     button_text = self.next_wp_label + '\n' + (self.next_stop if self.next_stop else "")
                     self.waypoint_btn.config(text=button_text)
+                    self._last_btn_text = button_text
                     self.waypoint_btn.update_idletasks()
                 except Exception:
                     pass
@@ -1136,7 +1349,7 @@ class GalaxyGPS():
             
             show_fuel_frame = False
             
-            logger.debug(f"[_update_widget_visibility] offset={self.offset}, route_len={len(self.route)}, galaxy={self.galaxy}, has_fuel_used={self.has_fuel_used}, fuel_used={self.fuel_used!r}, fuel_remaining={self.fuel_remaining!r}")
+            logger.debug("[_update_widget_visibility] offset=%s, route_len=%s, galaxy=%s, has_fuel_used=%s, fuel_used=%r, fuel_remaining=%r", self.offset, len(self.route), self.galaxy, self.has_fuel_used, self.fuel_used, self.fuel_remaining)
             
             # Show Fuel Used if available
             if self.has_fuel_used and self.fuel_used:
@@ -1144,22 +1357,22 @@ class GalaxyGPS():
                 self.fuel_used_lbl["text"] = f"{plugin_tl('Fuel Used')}: {self.fuel_used}"
                 self.fuel_used_lbl.pack(side=tk.LEFT, padx=(0, 10))
                 show_fuel_frame = True
-                logger.debug(f"[_update_widget_visibility] Showing Fuel Used label")
+                logger.debug("[_update_widget_visibility] Showing Fuel Used label")
             
             # Show Fuel Remaining for galaxy routes if available
             if self.galaxy and self.fuel_remaining:
                 self.fuel_remaining_lbl["text"] = f"{plugin_tl('Fuel Remaining')}: {self.fuel_remaining}"
                 self.fuel_remaining_lbl.pack(side=tk.LEFT)
                 show_fuel_frame = True
-                logger.debug(f"[_update_widget_visibility] Showing Fuel Remaining label")
+                logger.debug("[_update_widget_visibility] Showing Fuel Remaining label")
             
             # Show or hide the container frame based on whether any fuel labels are visible
             if show_fuel_frame:
                 self.fuel_labels_frame.grid()
-                logger.debug(f"[_update_widget_visibility] Showing fuel_labels_frame")
+                logger.debug("[_update_widget_visibility] Showing fuel_labels_frame")
             else:
                 self.fuel_labels_frame.grid_remove()
-                logger.debug(f"[_update_widget_visibility] Hiding fuel_labels_frame")
+                logger.debug("[_update_widget_visibility] Hiding fuel_labels_frame")
             
             # Update waypoint button states
             if self.offset == 0:
@@ -1186,7 +1399,7 @@ class GalaxyGPS():
 
     def update_gui(self):
         """Update the GUI based on current state"""
-        if len(self.route) > 0:
+        if self.route:
             self._update_widget_visibility('route')
             # Ensure waypoint button text is updated (especially important for Road to Riches)
             # This handles cases where next_stop might have been updated but button text wasn't refreshed
@@ -1195,6 +1408,7 @@ class GalaxyGPS():
                     # Use config() instead of direct assignment for more reliable updates
                     button_text = self.next_wp_label + '\n' + (self.next_stop if self.next_stop else "")
                     self.waypoint_btn.config(text=button_text)
+                    self._last_btn_text = button_text
                     self.waypoint_btn.update_idletasks()
                 except Exception:
                     pass  # Silently fail if button doesn't exist yet
@@ -1284,7 +1498,7 @@ class GalaxyGPS():
                             self.jumps_left += 1
                 
                 # Set next waypoint
-                if self.route and len(self.route) > 0:
+                if self.route:
                     self.next_stop = self.route[self.offset][0]
                     self.update_bodies_text()
                     self.compute_distances()
@@ -1302,6 +1516,8 @@ class GalaxyGPS():
                     for row in route_reader:
                         if row not in (None, "", []):
                             self.route.append(row)
+                self._rebuild_jumps_prefix()
+                self._rebuild_system_body_counts()
                 
                 # Load offset
                 try:
@@ -1323,7 +1539,7 @@ class GalaxyGPS():
                         else:
                             self.jumps_left += 1
                 
-                if self.route and len(self.route) > 0:
+                if self.route:
                     self.next_stop = self.route[self.offset][0]
                     self.update_bodies_text()
                     self.compute_distances()
@@ -1351,7 +1567,7 @@ class GalaxyGPS():
 
     def goto_next_waypoint(self):
         # allow manual navigation even if offset wasn't set by journal events yet
-        if len(self.route) == 0:
+        if not self.route:
             return
 
         if not hasattr(self, "offset") or self.offset is None:
@@ -1370,7 +1586,7 @@ class GalaxyGPS():
 
     def goto_prev_waypoint(self):
         # allow manual navigation even if offset wasn't set by journal events yet
-        if len(self.route) == 0:
+        if not self.route:
             return
 
         if not hasattr(self, "offset") or self.offset is None:
@@ -1713,53 +1929,53 @@ class GalaxyGPS():
                 self.dist_next = plugin_tl("Finished")
                 # For galaxy routes, still show fuel used from current row at last waypoint
                 if self.galaxy and self.has_fuel_used:
-                    logger.debug(f"[compute_distances] At last row, galaxy route with fuel_used column. cur length: {len(cur)}")
+                    logger.debug("[compute_distances] At last row, galaxy route with fuel_used column. cur length: %s", len(cur))
                     if len(cur) > 5:
                         fuel_used_value = cur[5] if cur[5] else None
-                        logger.debug(f"[compute_distances] fuel_used_value from cur[5]: {fuel_used_value}")
+                        logger.debug("[compute_distances] fuel_used_value from cur[5]: %s", fuel_used_value)
                         if fuel_used_value and fuel_used_value.strip():
                             try:
                                 val = float(fuel_used_value.strip())
                                 rounded_val = math.ceil(val * 100) / 100
                                 self.fuel_used = f"{rounded_val:.2f}"
-                                logger.debug(f"[compute_distances] Set fuel_used to: {self.fuel_used}")
+                                logger.debug("[compute_distances] Set fuel_used to: %s", self.fuel_used)
                             except (ValueError, TypeError):
                                 self.fuel_used = fuel_used_value.strip()
-                                logger.debug(f"[compute_distances] Set fuel_used (non-float) to: {self.fuel_used}")
+                                logger.debug("[compute_distances] Set fuel_used (non-float) to: %s", self.fuel_used)
                         else:
                             self.fuel_used = ""
-                            logger.debug(f"[compute_distances] fuel_used_value was empty/None, setting fuel_used to empty")
+                            logger.debug("[compute_distances] fuel_used_value was empty/None, setting fuel_used to empty")
                     else:
                         self.fuel_used = ""
-                        logger.debug(f"[compute_distances] cur length {len(cur)} <= 5, setting fuel_used to empty")
+                        logger.debug("[compute_distances] cur length %s <= 5, setting fuel_used to empty", len(cur))
                 # For fleet carrier routes, also show fuel used from current row at last waypoint
                 elif self.fleetcarrier and self.has_fuel_used:
-                    logger.debug(f"[compute_distances] At last row, fleet carrier route with fuel_used column. cur length: {len(cur)}")
+                    logger.debug("[compute_distances] At last row, fleet carrier route with fuel_used column. cur length: %s", len(cur))
                     # Fleet carrier routes have fuel used at index 5
                     if len(cur) > 5:
                         fuel_used_value = cur[5] if cur[5] else None
-                        logger.debug(f"[compute_distances] fuel_used_value from cur[5]: {fuel_used_value}")
+                        logger.debug("[compute_distances] fuel_used_value from cur[5]: %s", fuel_used_value)
                         if fuel_used_value and fuel_used_value.strip():
                             try:
                                 val = float(fuel_used_value.strip())
                                 rounded_val = math.ceil(val * 100) / 100
                                 self.fuel_used = f"{rounded_val:.2f}"
-                                logger.debug(f"[compute_distances] Set fuel_used to: {self.fuel_used}")
+                                logger.debug("[compute_distances] Set fuel_used to: %s", self.fuel_used)
                             except (ValueError, TypeError):
                                 self.fuel_used = fuel_used_value.strip()
-                                logger.debug(f"[compute_distances] Set fuel_used (non-float) to: {self.fuel_used}")
+                                logger.debug("[compute_distances] Set fuel_used (non-float) to: %s", self.fuel_used)
                         else:
                             self.fuel_used = ""
-                            logger.debug(f"[compute_distances] fuel_used_value was empty/None, setting fuel_used to empty")
+                            logger.debug("[compute_distances] fuel_used_value was empty/None, setting fuel_used to empty")
                     else:
                         self.fuel_used = ""
-                        logger.debug(f"[compute_distances] cur length {len(cur)} <= 5, setting fuel_used to empty")
+                        logger.debug("[compute_distances] cur length %s <= 5, setting fuel_used to empty", len(cur))
                 else:
                     self.fuel_used = ""
                     if self.galaxy:
-                        logger.debug(f"[compute_distances] Galaxy route but has_fuel_used={self.has_fuel_used}, setting fuel_used to empty")
+                        logger.debug("[compute_distances] Galaxy route but has_fuel_used=%s, setting fuel_used to empty", self.has_fuel_used)
                     elif self.fleetcarrier:
-                        logger.debug(f"[compute_distances] Fleet carrier route but has_fuel_used={self.has_fuel_used}, setting fuel_used to empty")
+                        logger.debug("[compute_distances] Fleet carrier route but has_fuel_used=%s, setting fuel_used to empty", self.has_fuel_used)
             # End of non-neutron route handling
 
         # --- Total remaining ---
@@ -1795,13 +2011,9 @@ class GalaxyGPS():
                     return
             
             # Not finished yet - sum all remaining jump values from the next row onwards
-            # Jumps are now at index 3
-            s = 0.0
-            for r in self.route[self.offset + 1:]:
-                if len(r) >= 4:
-                    v = safe_flt(r[3])
-                    if v is not None:
-                        s += v
+            # Jumps are now at index 3; fsum keeps long routes free of accumulated rounding error
+            jump_values = (safe_flt(r[3]) for r in self.route[self.offset + 1:] if len(r) >= 4)
+            s = math.fsum(v for v in jump_values if v is not None)
             
             if s > 0:
                 self.dist_remaining = f"{plugin_tl('Remaining jumps afterwards')}: {s:.2f}"
@@ -1817,34 +2029,28 @@ class GalaxyGPS():
 
         if total_rem is None:
             # Try summing distance_to_arrival of subsequent rows (index 2)
-            total = 0.0
-            ok = True
+            distances = []
             for r in self.route[self.offset + 1:]:
-                if len(r) >= 3:
-                    v = safe_flt(r[2])
-                    if v is None:
-                        ok = False
-                        break
-                    total += v
-                else:
-                    ok = False
+                v = safe_flt(r[2]) if len(r) >= 3 else None
+                if v is None:
                     break
-            if ok:
-                total_rem = total
+                distances.append(v)
+            else:
+                total_rem = math.fsum(distances)
 
         if total_rem is not None:
             self.dist_remaining = f"{plugin_tl('Remaining jumps afterwards')}: {total_rem:.2f}"
         else:
             # final fallback: sum numeric jumps (index 1) as approximate
-            s = 0.0
-            ok = True
+            jumps = []
             for r in self.route[self.offset + 1:]:
                 v = safe_flt(r[1])
                 if v is None:
-                    ok = False
+                    jumps = None
                     break
-                s += v
-            if ok and s > 0:
+                jumps.append(v)
+            s = math.fsum(jumps) if jumps is not None else 0.0
+            if s > 0:
                 self.dist_remaining = f"{plugin_tl('Remaining jumps afterwards')}: {s:.2f}"
             else:
                 self.dist_remaining = ""
@@ -1860,7 +2066,9 @@ class GalaxyGPS():
         Returns:
             int: Index of the next waypoint (0 if at start, or last index if at end)
         """
-        if not self.route or len(self.route) == 0:
+        route = self.route
+        n = len(route)
+        if n == 0:
             return 0
         
         # Determine which system to check based on route type
@@ -1873,16 +2081,9 @@ class GalaxyGPS():
                     current_system = carrier.get('current_system', '')
             # If no carrier selected or no carrier data, try to get the most recent carrier
             if not current_system:
-                carriers = self.get_all_fleet_carriers()
-                if carriers:
-                    # Get the most recently updated carrier
-                    sorted_carriers = sorted(
-                        carriers,
-                        key=lambda x: x.get('last_updated', ''),
-                        reverse=True
-                    )
-                    carrier = sorted_carriers[0]
-                    current_system = carrier.get('current_system', '') if carrier else None
+                # Get the most recently updated carrier
+                carrier = _most_recent_carrier(self.get_all_fleet_carriers())
+                current_system = carrier.get('current_system', '') if carrier else None
         else:
             # For non-fleet carrier routes, use the player's current system
             current_system = monitor.state.get('SystemName')
@@ -1898,7 +2099,7 @@ class GalaxyGPS():
         # (i.e., where the system matches), then advance to the next one
         found_index = -1
         
-        for idx, waypoint in enumerate(self.route):
+        for idx, waypoint in enumerate(route):
             # Use helper method to get system name (handles empty names for Road to Riches)
             waypoint_system = self._get_system_name_at_index(idx)
             if waypoint_system and waypoint_system.lower() == current_system_lower:
@@ -1912,37 +2113,22 @@ class GalaxyGPS():
             next_index = found_index + 1
             
             # Skip rows with the same system name (for Road to Riches where system names don't repeat)
-            while next_index < len(self.route):
+            while next_index < n:
                 next_system_name = self._get_system_name_at_index(next_index)
                 # If we found a different system name (or reached the end), use it
                 if next_system_name != current_waypoint_system:
                     break
                 next_index += 1
             
-            if next_index >= len(self.route):
+            if next_index >= n:
                 # We're at or past the last waypoint, stay at the last one
-                next_index = len(self.route) - 1
+                next_index = n - 1
             
             # Update jumps_left to account for skipping waypoints we've already passed
-            for idx in range(next_index):
-                if idx < len(self.route) and len(self.route[idx]) > 1:
-                    try:
-                        if self.fleetcarrier:
-                            # Fleet carrier routes: each row is 1 jump
-                            self.jumps_left -= 1
-                        elif self.neutron:
-                            # Neutron routes: jumps are at index 3
-                            if len(self.route[idx]) > 3 and self.route[idx][3] not in [None, "", []]:
-                                self.jumps_left -= int(self.route[idx][3])
-                        elif self.galaxy:
-                            # Galaxy routes: each row is 1 jump
-                            self.jumps_left -= 1
-                        else:
-                            # Generic routes: jumps are at index 1
-                            if len(self.route[idx]) > 1 and self.route[idx][1] not in [None, "", []]:
-                                self.jumps_left -= int(self.route[idx][1])
-                    except (ValueError, TypeError):
-                        pass
+            if len(self._jumps_prefix) != n:
+                self._rebuild_jumps_prefix()
+            if next_index > 0:
+                self.jumps_left -= self._jumps_prefix[next_index - 1]
             
             return next_index
         else:
@@ -1951,21 +2137,58 @@ class GalaxyGPS():
             # Could enhance this later to check distance to nearest waypoint
             return 0
     
+    def _rebuild_jumps_prefix(self):
+        """
+        Precompute cumulative jump counts for the loaded route.
+        _jumps_prefix[i] is the number of jumps in rows 0..i, counted the same way
+        update_route counts them for the current route type.
+        """
+        per_row = []
+        for row in self.route:
+            jumps = 0
+            if len(row) > 1:
+                if self.fleetcarrier:
+                    # Fleet carrier routes: each row is 1 jump
+                    jumps = 1
+                elif self.neutron:
+                    # Neutron routes: jumps are at index 3
+                    if len(row) > 3 and row[3] not in [None, "", []]:
+                        try:
+                            jumps = int(row[3])
+                        except (ValueError, TypeError):
+                            pass
+                elif self.galaxy:
+                    # Galaxy routes: each row is 1 jump
+                    jumps = 1
+                elif row[1] not in [None, "", []]:
+                    # Generic routes: jumps are at index 1
+                    try:
+                        jumps = int(row[1])
+                    except (ValueError, TypeError):
+                        pass
+            per_row.append(jumps)
+        self._jumps_prefix = list(itertools.accumulate(per_row))
+
+    def _rebuild_system_body_counts(self):
+        """Count route rows per system (case-insensitive) for the Road to Riches bodies display."""
+        self._system_body_counts = Counter(row[0].lower() for row in self.route if row and row[0])
+
     def _get_system_name_at_index(self, idx):
         """
         Get the system name at a given route index, handling empty system names for Road to Riches.
         For Road to Riches, if system name is empty, use the previous non-empty system name.
         """
-        if idx < 0 or idx >= len(self.route):
+        route = self.route
+        if idx < 0 or idx >= len(route):
             return None
         
-        system_name = self.route[idx][0] if len(self.route[idx]) > 0 else ""
+        system_name = route[idx][0] if len(route[idx]) > 0 else ""
         
         # For Road to Riches, if system name is empty, look backwards for the last non-empty name
         if self.roadtoriches and (not system_name or system_name.strip() == ""):
             # Look backwards to find the last non-empty system name
             for prev_idx in range(idx - 1, -1, -1):
-                prev_system = self.route[prev_idx][0] if len(self.route[prev_idx]) > 0 else ""
+                prev_system = route[prev_idx][0] if len(route[prev_idx]) > 0 else ""
                 if prev_system and prev_system.strip():
                     return prev_system.strip()
             return None
@@ -1973,8 +2196,13 @@ class GalaxyGPS():
         return system_name.strip() if system_name else None
 
     def update_route(self, direction=1):
+        """Move to the next (direction > 0) or previous waypoint with a different system name."""
+        # Bind the route once; the list is not reassigned while this method runs
+        route = self.route
+        n = len(route)
+
         # Guard: no route -> nothing to do
-        if len(self.route) == 0:
+        if n == 0:
             self.next_stop = "No route planned"
             self.update_gui()
             return
@@ -1988,12 +2216,12 @@ class GalaxyGPS():
         if self.offset < 0:
             logger.warning(f'[update_route] Offset was negative ({self.offset}), correcting to 0')
             self.offset = 0
-        if self.offset >= len(self.route):
-            logger.warning(f'[update_route] Offset ({self.offset}) >= route length ({len(self.route)}), correcting')
-            self.offset = len(self.route) - 1
+        if self.offset >= n:
+            logger.warning(f'[update_route] Offset ({self.offset}) >= route length ({n}), correcting')
+            self.offset = n - 1
         
         # Additional safety check: if route is empty after validation, reset
-        if len(self.route) == 0:
+        if n == 0:
             self.next_stop = "No route planned"
             self.update_gui()
             return
@@ -2013,19 +2241,19 @@ class GalaxyGPS():
                     self.jumps_left -= 1
                 elif self.neutron:
                     # Neutron routes: jumps are at index 3
-                    if len(self.route[self.offset]) > 3 and self.route[self.offset][3] not in [None, "", []]:
-                        self.jumps_left -= int(self.route[self.offset][3])
+                    if len(route[self.offset]) > 3 and route[self.offset][3] not in [None, "", []]:
+                        self.jumps_left -= int(route[self.offset][3])
                 elif self.galaxy:
                     # Galaxy routes: each row is 1 jump
                     self.jumps_left -= 1
                 else:
                     # Generic routes: jumps are at index 1
-                    if len(self.route[self.offset]) > 1 and self.route[self.offset][1] not in [None, "", []]:
-                        self.jumps_left -= int(self.route[self.offset][1])
+                    if len(route[self.offset]) > 1 and route[self.offset][1] not in [None, "", []]:
+                        self.jumps_left -= int(route[self.offset][1])
                 
                 # Find next row with different system name
                 new_offset = self.offset
-                while new_offset < len(self.route) - 1:
+                while new_offset < n - 1:
                     new_offset += 1
                     next_system_name = self._get_system_name_at_index(new_offset)
                     # Handle None case
@@ -2037,7 +2265,7 @@ class GalaxyGPS():
                         break
                 else:
                     # Reached end of route without finding different system
-                    self.offset = len(self.route) - 1
+                    self.offset = n - 1
             else:
                 # Moving backward: skip to previous row with different system name
                 if self.offset > 0:
@@ -2058,15 +2286,15 @@ class GalaxyGPS():
                                 self.jumps_left += 1
                             elif self.neutron:
                                 # Neutron routes: jumps are at index 3
-                                if len(self.route[self.offset]) > 3 and self.route[self.offset][3] not in [None, "", []]:
-                                    self.jumps_left += int(self.route[self.offset][3])
+                                if len(route[self.offset]) > 3 and route[self.offset][3] not in [None, "", []]:
+                                    self.jumps_left += int(route[self.offset][3])
                             elif self.galaxy:
                                 # Galaxy routes: each row is 1 jump
                                 self.jumps_left += 1
                             else:
                                 # Generic routes: jumps are at index 1
-                                if len(self.route[self.offset]) > 1 and self.route[self.offset][1] not in [None, "", []]:
-                                    self.jumps_left += int(self.route[self.offset][1])
+                                if len(route[self.offset]) > 1 and route[self.offset][1] not in [None, "", []]:
+                                    self.jumps_left += int(route[self.offset][1])
                             break
                     else:
                         # Reached beginning without finding different system, stay at current
@@ -2074,10 +2302,10 @@ class GalaxyGPS():
         except Exception:
             # If something odd in route contents, try to recover by resetting offset to 0
             logger.warning('!! ' + traceback.format_exc(), exc_info=False)
-            self.offset = max(0, min(self.offset, len(self.route) - 1))
+            self.offset = max(0, min(self.offset, n - 1))
 
         # Now update next_stop and GUI according to new offset
-        if self.offset >= len(self.route):
+        if self.offset >= n:
             self.next_stop = "End of the road!"
             self.update_gui()
         else:
@@ -2088,11 +2316,11 @@ class GalaxyGPS():
             else:
                 # Fallback to raw value if we can't determine system name
                 # For Road to Riches, if raw value is empty, look backwards for system name
-                raw_system = self.route[self.offset][0] if len(self.route[self.offset]) > 0 else ""
+                raw_system = route[self.offset][0] if len(route[self.offset]) > 0 else ""
                 if not raw_system and self.roadtoriches and self.offset > 0:
                     # Look backwards for the last non-empty system name
                     for prev_idx in range(self.offset - 1, -1, -1):
-                        prev_system = self.route[prev_idx][0] if len(self.route[prev_idx]) > 0 else ""
+                        prev_system = route[prev_idx][0] if len(route[prev_idx]) > 0 else ""
                         if prev_system and prev_system.strip():
                             self.next_stop = prev_system.strip()
                             break
@@ -2113,7 +2341,7 @@ class GalaxyGPS():
 
             if self.galaxy:
                 try:
-                    self.pleaserefuel = self.route[self.offset][1] == "Yes"
+                    self.pleaserefuel = route[self.offset][1] == "Yes"
                 except Exception as e:
                     logger.warning(f'[update_route] Exception setting pleaserefuel: {e}', exc_info=True)
             
@@ -2128,8 +2356,7 @@ class GalaxyGPS():
             try:
                 self.update_gui()
             except Exception as e:
-                logger.error(f'[update_route] Exception in update_gui(): {e}', exc_info=True)
-                raise  # Re-raise to see the full stack trace
+                logger.warning(f'[update_route] Exception in update_gui(): {e}', exc_info=True)
             
             # CRITICAL: Explicitly update button text AFTER next_stop is set
             # This is especially important for Road to Riches where system names might be empty
@@ -2159,11 +2386,14 @@ class GalaxyGPS():
                             current_next_stop = self.next_stop if hasattr(self, 'next_stop') and self.next_stop else ""
                         
                         button_text = self.next_wp_label + '\n' + current_next_stop
+                        if button_text == self._last_btn_text:
+                            return  # Already showing this text, nothing to redraw
 
                         # Update using config() for more reliable updates
                         # Use both config() and direct assignment to ensure it works
                         self.waypoint_btn.config(text=button_text)
                         self.waypoint_btn["text"] = button_text
+                        self._last_btn_text = button_text
                         # Force immediate GUI update
                         self.waypoint_btn.update_idletasks()
                         # Also update the parent frame to ensure visibility
@@ -2202,23 +2432,10 @@ class GalaxyGPS():
             
             self.copy_waypoint()
             
-            # CRITICAL: Validate route and offset after all operations
-            # This ensures they remain valid even if window operations interfere
-            if hasattr(self, 'route') and hasattr(self, 'offset'):
-                if self.offset < 0:
-                    self.offset = 0
-                if self.offset >= len(self.route):
-                    self.offset = len(self.route) - 1 if len(self.route) > 0 else 0
-                # Re-validate next_stop after offset validation
-                if self.offset < len(self.route):
-                    display_system_name = self._get_system_name_at_index(self.offset)
-                    if display_system_name:
-                        self.next_stop = display_system_name
-            
             # Refresh route window if open to update highlighted waypoint
             # Do this after all GUI updates to ensure consistency
             try:
-                refresh_route_window_if_open(self)
+                self._schedule_refresh('route', self.refresh_route_window_if_open)
             except Exception as e:
                 logger.warning(f'Error refreshing route window: {e}', exc_info=False)
             
@@ -2237,7 +2454,7 @@ class GalaxyGPS():
                         if hasattr(self, 'route') and hasattr(self, 'offset'):
                             if self.offset < 0 or self.offset >= len(self.route):
                                 # Offset is invalid, try to recover
-                                if len(self.route) > 0:
+                                if self.route:
                                     self.offset = max(0, min(self.offset, len(self.route) - 1))
                                 else:
                                     return
@@ -2255,9 +2472,12 @@ class GalaxyGPS():
                         else:
                             current_next_stop = self.next_stop if hasattr(self, 'next_stop') and self.next_stop else ""
                         button_text = self.next_wp_label + '\n' + current_next_stop
+                        if button_text == self._last_btn_text:
+                            return  # Already showing this text, nothing to redraw
                         # Use both methods to ensure update
                         self.waypoint_btn.config(text=button_text)
                         self.waypoint_btn["text"] = button_text
+                        self._last_btn_text = button_text
                         self.waypoint_btn.update_idletasks()
                         
                         # Verify the update (log only on mismatch)
@@ -2294,35 +2514,24 @@ class GalaxyGPS():
         ]
         filename = filedialog.askopenfilename(filetypes = ftypes, initialdir=os.path.expanduser('~'))
 
-        if filename.__len__() > 0:
+        if filename:
             try:
-                ftype_supported = False
                 if filename.endswith(".csv"):
-                    ftype_supported = True
                     # Store the original CSV path so we can read all columns later
                     self.original_csv_path = filename
-                    self.plot_csv(filename)
+                    # Large CSV files take a while to parse: read them on a worker thread
+                    self.enable_plot_gui(False)
+                    # Bound here rather than at frame creation so a rebuilt frame still gets the result
+                    self.frame.bind(CSV_READY_EVENT, self._apply_csv_result)
+                    threading.Thread(
+                        target=self._run_plot_csv_worker,
+                        args=(filename,),
+                        daemon=True,
+                    ).start()
 
                 elif filename.endswith(".txt"):
-                    ftype_supported = True
                     self.plot_edts(filename)
-
-                if ftype_supported:
-                    # Find where we are in the route based on current system location
-                    self.offset = self.find_current_waypoint_in_route()
-                    
-                    self.next_stop = self.route[self.offset][0] if self.route else ""
-                    if self.galaxy:
-                        self.pleaserefuel = self.route[self.offset][1] == "Yes" if self.route and len(self.route[self.offset]) > 1 else False
-                    self.update_bodies_text()
-                    self.compute_distances()
-                    self.copy_waypoint()
-                    self.update_gui()
-                    # Check fleet carrier restock warning
-                    if self.fleetcarrier and hasattr(self, 'check_fleet_carrier_restock_warning'):
-                        self.check_fleet_carrier_restock_warning()
-                    # Save route to cache (now preserves all columns via route_full_data)
-                    self.save_all_route()
+                    self._finish_file_import()
                 else:
                     self.show_error("Unsupported file type")
             except Exception:
@@ -2330,460 +2539,418 @@ class GalaxyGPS():
                 self.enable_plot_gui(True)
                 self.show_error("(1) An error occured while reading the file.")
 
-    def plot_csv(self, filename, clear_previous_route=True):
-        with open(filename, 'r', encoding='utf-8-sig', newline='') as csvfile:
-            self.roadtoriches = False
-            self.fleetcarrier = False
-            self.galaxy = False
-            self.neutron = False
+    def _finish_file_import(self):
+        """Position the freshly imported route at the current location and refresh the UI."""
+        # Find where we are in the route based on current system location
+        self.offset = self.find_current_waypoint_in_route()
+        
+        self.next_stop = self.route[self.offset][0] if self.route else ""
+        if self.galaxy:
+            self.pleaserefuel = self.route[self.offset][1] == "Yes" if self.route and len(self.route[self.offset]) > 1 else False
+        self.update_bodies_text()
+        self.compute_distances()
+        self.copy_waypoint()
+        self.update_gui()
+        # Check fleet carrier restock warning
+        if self.fleetcarrier and hasattr(self, 'check_fleet_carrier_restock_warning'):
+            self.check_fleet_carrier_restock_warning()
+        # Save route to cache (now preserves all columns via route_full_data)
+        self.save_all_route()
 
-            if clear_previous_route:
-                self.clear_route(False)
-                self.has_fuel_used = False  # Reset flag when clearing route
-
-            route_reader = csv.DictReader(csvfile)
-            fieldnames = route_reader.fieldnames if route_reader.fieldnames else []
-            
-            # Store full CSV data for View Route window (preserve all columns)
-            self.route_full_data = []
-            self.route_fieldnames = fieldnames  # Preserve original fieldnames for display
-            
-            # Create case-insensitive fieldname mapping
-            fieldname_map = {name.lower(): name for name in fieldnames}
-            
-            def get_field(row, field_name, default=""):
-                """Get field value from row using case-insensitive lookup"""
-                key = fieldname_map.get(field_name.lower(), field_name)
-                return row.get(key, default)
-            
-            def has_field(field_name):
-                """Check if field exists in header (case-insensitive)"""
-                return field_name.lower() in fieldname_map
-            
-            headerline = ','.join(fieldnames) if fieldnames else ""
-            headerline_lower = headerline.lower()
-
-            internalbasicheader1 = "System Name"
-            internalbasicheader2 = "System Name,Jumps"
-            internalrichesheader = "System Name,Jumps,Body Name,Body Subtype"
-            internalfleetcarrierheader_with_distances = "System Name,Distance,Distance Remaining,Tritium in tank,Tritium in market,Fuel Used,Icy Ring,Pristine,Restock Tritium"
-            internalfleetcarrierheader = "System Name,Distance,Distance Remaining,Tritium in tank,Tritium in market,Fuel Used,Icy Ring,Pristine,Restock Tritium"
-            internalgalaxyheader = "System Name,Refuel"
-            neutronimportheader = "System Name,Distance To Arrival,Distance Remaining,Neutron Star,Jumps"
-            road2richesimportheader = "System Name,Body Name,Body Subtype,Is Terraformable,Distance To Arrival,Estimated Scan Value,Estimated Mapping Value,Jumps"
-            fleetcarrierimportheader = "System Name,Distance,Distance Remaining,Tritium in tank,Tritium in market,Fuel Used,Icy Ring,Pristine,Restock Tritium"
-            galaxyimportheader = "System Name,Distance,Distance Remaining,Fuel Left,Fuel Used,Refuel,Neutron Star"
-
-            def get_distance_fields(row):
-                dist_to_arrival = get_field(row, "Distance To Arrival", "") or get_field(row, "Distance", "")
-                dist_remaining = get_field(row, "Distance Remaining", "")
-                
-                # Round distance values UP to nearest hundredth (2 decimal places)
-                def round_distance(value):
-                    if not value or value == "":
-                        return ""
-                    try:
-                        val = float(value)
-                        # Round UP to nearest hundredth: multiply by 100, ceil, divide by 100
-                        rounded = math.ceil(val * 100) / 100
-                        return f"{rounded:.2f}"
-                    except (ValueError, TypeError):
-                        return value  # Return as-is if not a number
-                
-                return round_distance(dist_to_arrival), round_distance(dist_remaining)
-
-            # --- neutron import ---
-            if headerline_lower == neutronimportheader.lower():
-                self.neutron = True  # Flag neutron routes for special cumulative jump handling
-                logger.info(f"[plot_csv] Importing neutron route with headers: {fieldnames}")
-                for row in route_reader:
-                    if row not in (None, "", []):
-                        # Store full row data (all columns)
-                        full_row_data = {}
-                        for field_name in fieldnames:
-                            full_row_data[field_name.lower()] = get_field(row, field_name, '')
-                        self.route_full_data.append(full_row_data)
-                        
-                        # Store minimal route data for route planner
-                        # Neutron format: [System Name, Distance To Arrival, Distance Remaining, Jumps]
-                        dist_to_arrival, dist_remaining = get_distance_fields(row)
-                        jumps_value = get_field(row, self.jumps_header, "")
-                        route_row = [
-                            get_field(row, self.system_header),
-                            dist_to_arrival,
-                            dist_remaining,
-                            jumps_value
-                        ]
-                        self.route.append(route_row)
-                        logger.debug(f"[plot_csv] Neutron row: {route_row}")
-                        try:
-                            jumps_val = get_field(row, self.jumps_header, "0")
-                            self.jumps_left += int(jumps_val)
-                        except (ValueError, TypeError):
-                            pass
+    def _run_plot_csv_worker(self, filename):
+        """Worker: read and parse a route CSV off the main thread, put result in queue."""
+        try:
+            self._csv_queue.put({'ok': True, 'parsed': self._read_route_csv(filename)})
+        except Exception:
+            logger.warning('!! ' + traceback.format_exc(), exc_info=False)
+            self._csv_queue.put({'ok': False})
+        self._notify_main_thread(CSV_READY_EVENT)
 
-            # --- Check for Road to Riches import ---
-            if headerline_lower == road2richesimportheader.lower():
-                self.roadtoriches = True
-                logger.info(f"[plot_csv] Detected Road to Riches route with headers: {fieldnames}")
-
-            # --- simple internal ---
-            if headerline_lower in (internalbasicheader1.lower(), internalbasicheader2.lower()):
-                for row in route_reader:
-                    if row not in (None, "", []):
-                        # Store full row data (all columns)
-                        full_row_data = {}
-                        for field_name in fieldnames:
-                            full_row_data[field_name.lower()] = get_field(row, field_name, '')
-                        self.route_full_data.append(full_row_data)
-                        
-                        # Store minimal route data for route planner
-                        self.route.append([
-                            get_field(row, self.system_header),
-                            get_field(row, self.jumps_header, "")
-                        ])
-                        try:
-                            jumps_val = get_field(row, self.jumps_header, "0")
-                            self.jumps_left += int(jumps_val)
-                        except (ValueError, TypeError):
-                            pass
+    def _apply_csv_result(self, event=None):
+        """Main thread: install the route the CSV worker queued and update UI."""
+        if getattr(config, 'shutting_down', False):
+            return
+        try:
+            r = self._csv_queue.get_nowait()
+        except queue.Empty:
+            return
 
-            # --- internal fleetcarrier WITH distances (load after restart) ---
-            elif headerline_lower == internalfleetcarrierheader_with_distances.lower():
-                self.fleetcarrier = True
-                self.has_fuel_used = has_field('Fuel Used')
-
-                for row in route_reader:
-                    if row not in (None, "", []):
-                        # Store full row data (all columns)
-                        full_row_data = {}
-                        for field_name in fieldnames:
-                            full_row_data[field_name.lower()] = get_field(row, field_name, '')
-                        self.route_full_data.append(full_row_data)
-                        
-                        # Store minimal route data for route planner
-                        # Fleet Carrier format: [System Name, Distance, Distance Remaining, Tritium in tank, Tritium in market, Fuel Used, Icy Ring, Pristine, Restock Tritium]
-                        dist_to_arrival, dist_remaining = get_distance_fields(row)
-                        
-                        route_entry = [
-                            get_field(row, self.system_header),                    # 0: System Name
-                            dist_to_arrival,                                       # 1: Distance
-                            dist_remaining,                                        # 2: Distance Remaining
-                            get_field(row, 'Tritium in tank', ''),                # 3: Tritium in tank
-                            get_field(row, 'Tritium in market', ''),              # 4: Tritium in market
-                        ]
-                        
-                        # Add Fuel Used if present
-                        if self.has_fuel_used:
-                            fuel_used_raw = get_field(row, 'Fuel Used', '')
-                            if fuel_used_raw:
-                                try:
-                                    val = float(fuel_used_raw)
-                                    rounded_val = math.ceil(val * 100) / 100
-                                    route_entry.append(f"{rounded_val:.2f}")       # 5: Fuel Used
-                                except (ValueError, TypeError):
-                                    route_entry.append(fuel_used_raw)
-                            else:
-                                route_entry.append('')
-                        else:
-                            route_entry.append('')  # 5: Fuel Used placeholder
-                        
-                        route_entry.append(get_field(row, 'Icy Ring', ''))        # 6: Icy Ring
-                        route_entry.append(get_field(row, 'Pristine', ''))        # 7: Pristine
-                        route_entry.append(get_field(row, self.restocktritium_header, ''))  # 8: Restock Tritium
-                        
-                        self.route.append(route_entry)
-                        # For internal format with distances, each row is 1 jump
-                        self.jumps_left += 1
-
-            # --- internal fleetcarrier (legacy, no distances) ---
-            elif headerline_lower == internalfleetcarrierheader.lower():
-                self.fleetcarrier = True
-                self.has_fuel_used = has_field('Fuel Used')
-
-                for row in route_reader:
-                    if row not in (None, "", []):
-                        # Store full row data (all columns)
-                        full_row_data = {}
-                        for field_name in fieldnames:
-                            full_row_data[field_name.lower()] = get_field(row, field_name, '')
-                        self.route_full_data.append(full_row_data)
-                        
-                        # Store minimal route data for route planner
-                        # Fleet Carrier format: [System Name, Distance, Distance Remaining, Tritium in tank, Tritium in market, Fuel Used, Icy Ring, Pristine, Restock Tritium]
-                        route_entry = [
-                            get_field(row, self.system_header),                    # 0: System Name
-                            "",                                                    # 1: Distance (placeholder)
-                            "",                                                    # 2: Distance Remaining (placeholder)
-                            get_field(row, 'Tritium in tank', ''),                # 3: Tritium in tank
-                            get_field(row, 'Tritium in market', ''),              # 4: Tritium in market
-                        ]
-                        
-                        # Add Fuel Used if present
-                        if self.has_fuel_used:
-                            fuel_used_raw = get_field(row, 'Fuel Used', '')
-                            if fuel_used_raw:
-                                try:
-                                    val = float(fuel_used_raw)
-                                    rounded_val = math.ceil(val * 100) / 100
-                                    route_entry.append(f"{rounded_val:.2f}")       # 5: Fuel Used
-                                except (ValueError, TypeError):
-                                    route_entry.append(fuel_used_raw)
-                            else:
-                                route_entry.append('')
-                        else:
-                            route_entry.append('')  # 5: Fuel Used placeholder
-                        
-                        route_entry.append(get_field(row, 'Icy Ring', ''))        # 6: Icy Ring
-                        route_entry.append(get_field(row, 'Pristine', ''))        # 7: Pristine
-                        route_entry.append(get_field(row, self.restocktritium_header, ''))  # 8: Restock Tritium
-                        
-                        self.route.append(route_entry)
-                        # Legacy format, each row is 1 jump
-                        self.jumps_left += 1
-
-            # --- EXTERNAL fleetcarrier import (WITH LY SUPPORT) ---
-            elif headerline_lower == fleetcarrierimportheader.lower():
-                self.fleetcarrier = True
-                self.has_fuel_used = has_field('Fuel Used')
-
-                for row in route_reader:
-                    if row not in (None, "", []):
-                        # Store full row data (all columns)
-                        full_row_data = {}
-                        for field_name in fieldnames:
-                            field_value = get_field(row, field_name, '')
-                            # Round distance values if present
-                            if field_name.lower() in ["distance to arrival", "distance remaining", "distance"]:
-                                if field_value:
-                                    try:
-                                        val = float(field_value)
-                                        rounded_val = math.ceil(val * 100) / 100
-                                        field_value = f"{rounded_val:.2f}"
-                                    except (ValueError, TypeError):
-                                        pass
-                            full_row_data[field_name.lower()] = field_value
-                        self.route_full_data.append(full_row_data)
-                        
-                        # Store minimal route data for route planner
-                        # Fleet Carrier format: [System Name, Distance, Distance Remaining, Tritium in tank, Tritium in market, Fuel Used, Icy Ring, Pristine, Restock Tritium]
-                        dist_to_arrival, dist_remaining = get_distance_fields(row)
-
-                        route_entry = [
-                            get_field(row, self.system_header),                    # 0: System Name
-                            dist_to_arrival,                                       # 1: Distance
-                            dist_remaining,                                        # 2: Distance Remaining
-                            get_field(row, 'Tritium in tank', ''),                # 3: Tritium in tank
-                            get_field(row, 'Tritium in market', ''),              # 4: Tritium in market
-                        ]
-                        
-                        # Store Fuel Used if present (round UP to nearest hundredth)
-                        if self.has_fuel_used:
-                            fuel_used_raw = get_field(row, 'Fuel Used', '')
-                            if fuel_used_raw:
-                                try:
-                                    val = float(fuel_used_raw)
-                                    rounded_val = math.ceil(val * 100) / 100
-                                    route_entry.append(f"{rounded_val:.2f}")       # 5: Fuel Used
-                                except (ValueError, TypeError):
-                                    route_entry.append(fuel_used_raw)
-                            else:
-                                route_entry.append('')
-                        else:
-                            route_entry.append('')  # 5: Fuel Used placeholder
-                        
-                        # Store Icy Ring and Pristine if present (for route view window)
-                        if has_field('Icy Ring'):
-                            route_entry.append(get_field(row, 'Icy Ring', ''))    # 6: Icy Ring
-                        else:
-                            route_entry.append('')
-                        
-                        if has_field('Pristine'):
-                            route_entry.append(get_field(row, 'Pristine', ''))    # 7: Pristine
-                        else:
-                            route_entry.append('')
-                        
-                        route_entry.append(get_field(row, self.restocktritium_header, ''))  # 8: Restock Tritium
-                        
-                        self.route.append(route_entry)
-                        self.jumps_left += 1
-
-            # --- galaxy ---
-            elif has_field("Refuel") and has_field(self.system_header):
-                self.galaxy = True
-                self.has_fuel_used = has_field('Fuel Used')
-                has_fuel_left = has_field('Fuel Left')
-
-                for row in route_reader:
-                    if row not in (None, "", []):
-                        # Store full row data (all columns)
-                        full_row_data = {}
-                        for field_name in fieldnames:
-                            field_value = get_field(row, field_name, '')
-                            # Round distance values if present
-                            if field_name.lower() in ["distance to arrival", "distance remaining", "distance"]:
-                                if field_value:
-                                    try:
-                                        val = float(field_value)
-                                        rounded_val = math.ceil(val * 100) / 100
-                                        field_value = f"{rounded_val:.2f}"
-                                    except (ValueError, TypeError):
-                                        pass
-                            full_row_data[field_name.lower()] = field_value
-                        self.route_full_data.append(full_row_data)
-                        
-                        # Store minimal route data for route planner
-                        dist_to_arrival, dist_remaining = get_distance_fields(row)
+        self.enable_plot_gui(True)
+        if not r['ok']:
+            self.show_error("(1) An error occured while reading the file.")
+            return
+        try:
+            self._apply_route_csv(r['parsed'])
+            self._rebuild_jumps_prefix()
+            self._rebuild_system_body_counts()
+            self._finish_file_import()
+        except Exception:
+            logger.warning('!! ' + traceback.format_exc(), exc_info=False)
+            self.show_error("(1) An error occured while reading the file.")
+
+    # Route CSV layouts recognised by their exact header line (lowercase), mapped to the
+    # method that parses them. Any other header is matched by _detect_csv_parser().
+    # Matching is a single dict lookup, so new layouts can be added here at no cost.
+    _CSV_PARSERS = {
+        _LC_SYSTEM: '_parse_basic_csv',
+        ','.join((_LC_SYSTEM, _LC_JUMPS)): '_parse_basic_csv',
+        ','.join((_LC_SYSTEM, "distance", "distance remaining", "tritium in tank", "tritium in market",
+                  "fuel used", "icy ring", "pristine", _LC_RESTOCKTRITIUM)): '_parse_fleetcarrier_csv',
+        ','.join((_LC_SYSTEM, "distance to arrival", "distance remaining", "neutron star",
+                  _LC_JUMPS)): '_parse_neutron_csv',
+        ','.join((_LC_SYSTEM, _LC_BODYNAME, _LC_BODYSUBTYPE, "is terraformable", "distance to arrival",
+                  "estimated scan value", "estimated mapping value", _LC_JUMPS)): '_parse_roadtoriches_csv',
+    }
 
-                        route_row = [
-                            get_field(row, self.system_header, ""),
-                            get_field(row, self.refuel_header, "")
-                        ]
+    def plot_csv(self, filename, clear_previous_route=True):
+        self._apply_route_csv(self._read_route_csv(filename), clear_previous_route)
 
-                        if dist_to_arrival or dist_remaining:
-                            route_row.append(dist_to_arrival)
-                            route_row.append(dist_remaining)
-                            
-                            # Store Fuel Left if present at index 4 (round UP to nearest hundredth)
-                            if has_fuel_left:
-                                fuel_left_raw = get_field(row, 'Fuel Left', '')
-                                if fuel_left_raw:
-                                    try:
-                                        val = float(fuel_left_raw)
-                                        rounded_val = math.ceil(val * 100) / 100
-                                        route_row.append(f"{rounded_val:.2f}")
-                                    except (ValueError, TypeError):
-                                        route_row.append(fuel_left_raw)
-                                else:
-                                    route_row.append('')
-                            else:
-                                # No Fuel Left column - add empty placeholder
-                                route_row.append("")
-                        
-                        # Store Fuel Used if present at index 5 (round UP to nearest hundredth)
-                        if self.has_fuel_used:
-                            fuel_used_raw = get_field(row, 'Fuel Used', '')
-                            if fuel_used_raw:
-                                try:
-                                    val = float(fuel_used_raw)
-                                    rounded_val = math.ceil(val * 100) / 100
-                                    route_row.append(f"{rounded_val:.2f}")
-                                except (ValueError, TypeError):
-                                    route_row.append(fuel_used_raw)
-                            else:
-                                route_row.append('')
+        self._rebuild_jumps_prefix()
+        self._rebuild_system_body_counts()
+        if self.route:
+            # Find where we are in the route based on current system location
+            self.offset = self.find_current_waypoint_in_route()
+            
+            self.next_stop = self.route[self.offset][0]
+            self.update_bodies_text()  # Update bodies text for Road to Riches routes
+            self.compute_distances()
+            self.update_gui()
+            # Check fleet carrier restock warning
+            if self.fleetcarrier and hasattr(self, 'check_fleet_carrier_restock_warning'):
+                self.check_fleet_carrier_restock_warning()
+
+    def _apply_route_csv(self, parsed, clear_previous_route=True):
+        """Install a route parsed by _read_route_csv() as the current route (main thread)."""
+        if clear_previous_route:
+            self.clear_route(False)
+            self.has_fuel_used = False  # Reset flag when clearing route
+
+        self.roadtoriches = parsed['roadtoriches']
+        self.fleetcarrier = parsed['fleetcarrier']
+        self.galaxy = parsed['galaxy']
+        self.neutron = parsed['neutron']
+        if 'has_fuel_used' in parsed:
+            self.has_fuel_used = parsed['has_fuel_used']
+
+        self.route.extend(parsed['route'])
+        # Store full CSV data for View Route window (preserve all columns)
+        self.route_full_data = parsed['route_full_data']
+        self.route_fieldnames = parsed['route_fieldnames']  # Preserve original fieldnames for display
+        self.jumps_left += parsed['jumps_left']
+
+    def _read_route_csv(self, filename):
+        """
+        Read and parse a route CSV file without changing plugin state, so it can run
+        on a worker thread.
 
-                        self.route.append(route_row)
-                        self.jumps_left += 1
+        Returns:
+            dict: 'route', 'route_full_data', 'route_fieldnames', 'jumps_left', the route
+            type flags and, when the format defines it, 'has_fuel_used'
+        """
+        # 1 MB read buffer: large route exports are read in a few syscalls instead of 8 KB chunks
+        with open(filename, 'r', encoding='utf-8-sig', newline='', buffering=1 << 20) as csvfile:
+            raw_reader = csv.reader(csvfile)
+            fieldnames = next(raw_reader, None) or []
+            width = len(fieldnames)
+
+            def read_rows():
+                """Yield data rows as lists padded to the header width, skipping blank lines.
+
+                Short rows are padded with None as csv.DictReader did, and one trailing ''
+                is appended so fields missing from the header read as empty.
+                """
+                for row in raw_reader:
+                    if not row:
+                        continue
+                    n = len(row)
+                    if n < width:
+                        row.extend([None] * (width - n))
+                    elif n > width:
+                        del row[width:]
+                    row.append('')
+                    yield row
+
+            route_reader = read_rows()
+            parsed = {
+                'route': [],
+                'route_full_data': [],
+                'route_fieldnames': fieldnames,
+                'jumps_left': 0,
+                'roadtoriches': False,
+                'fleetcarrier': False,
+                'galaxy': False,
+                'neutron': False,
+            }
+            
+            # Case-insensitive header: lowercase column name -> column index.
+            # Also answers "does the file have this column" with a plain 'in' test.
+            column_index = {name.lower(): i for i, name in enumerate(fieldnames)}
+
+            # Column index of every field the parsers read, resolved once up front.
+            # Fields missing from the header point at the trailing '' added by read_rows().
+            # Known headers use the _LC_* forms, so no header name is lowercased per load.
+            index_of = column_index.get
+            cols = {
+                'system': index_of(_LC_SYSTEM, width),
+                'jumps': index_of(_LC_JUMPS, width),
+                'refuel': index_of(_LC_REFUEL, width),
+                'restock': index_of(_LC_RESTOCKTRITIUM, width),
+                'tritium in tank': index_of('tritium in tank', width),
+                'tritium in market': index_of('tritium in market', width),
+                'fuel used': index_of('fuel used', width),
+                'fuel left': index_of('fuel left', width),
+                'icy ring': index_of('icy ring', width),
+                'pristine': index_of('pristine', width),
+                'distance to arrival': index_of('distance to arrival', width),
+                'distance': index_of('distance', width),
+                'distance remaining': index_of('distance remaining', width),
+            }
+
+            headerline_lower = ','.join(fieldnames).lower()
+            parser = self._CSV_PARSERS.get(headerline_lower) or self._detect_csv_parser(column_index)
+            getattr(self, parser)(parsed, route_reader, cols, column_index)
+            return parsed
+
+    def _detect_csv_parser(self, column_index):
+        """Pick the parser for a route CSV whose header is not one of the known layouts."""
+        # Galaxy plotter export: System Name,Distance,Distance Remaining,Fuel Left,Fuel Used,Refuel,Neutron Star
+        if _LC_REFUEL in column_index and _LC_SYSTEM in column_index:
+            return '_parse_galaxy_csv'
+        return '_parse_generic_csv'
+
+    def _parse_neutron_csv(self, parsed, rows, cols, column_index):
+        """Neutron plotter export: [System Name, Distance To Arrival, Distance Remaining, Jumps]"""
+        parsed['neutron'] = True  # Flag neutron routes for special cumulative jump handling
+        parsed['has_fuel_used'] = False
+        logger.info(f"[plot_csv] Importing neutron route with headers: {parsed['route_fieldnames']}")
+        system_col = cols['system']
+        jumps_col = cols['jumps']
+        arrival_col = cols['distance to arrival']
+        distance_col = cols['distance']
+        remaining_col = cols['distance remaining']
+        append_full = parsed['route_full_data'].append
+        append_route = parsed['route'].append
+        jump_cells = []
+
+        for row in rows:
+            # Store full row data (all columns)
+            append_full(_RouteRow(row, column_index))
+            
+            # Store minimal route data for route planner
+            # Neutron format: [System Name, Distance To Arrival, Distance Remaining, Jumps]
+            jumps_value = row[jumps_col]
+            route_row = [
+                row[system_col],
+                _round_distance(row[arrival_col] or row[distance_col]),
+                _round_distance(row[remaining_col]),
+                jumps_value
+            ]
+            append_route(route_row)
+            logger.debug(f"[plot_csv] Neutron row: {route_row}")
+            jump_cells.append(jumps_value)
+
+        parsed['jumps_left'] = _sum_jumps(jump_cells)
+
+    def _parse_roadtoriches_csv(self, parsed, rows, cols, column_index):
+        """Road to Riches export: parsed like a generic route, with bodies shown per system."""
+        parsed['roadtoriches'] = True
+        logger.info(f"[plot_csv] Detected Road to Riches route with headers: {parsed['route_fieldnames']}")
+        self._parse_generic_csv(parsed, rows, cols, column_index)
+
+    def _parse_basic_csv(self, parsed, rows, cols, column_index):
+        """Simple internal route: [System Name, Jumps]"""
+        system_col = cols['system']
+        jumps_col = cols['jumps']
+        append_full = parsed['route_full_data'].append
+        append_route = parsed['route'].append
+        jump_cells = []
+
+        for row in rows:
+            # Store full row data (all columns)
+            append_full(_RouteRow(row, column_index))
+            
+            # Store minimal route data for route planner
+            jumps_value = row[jumps_col]
+            append_route([
+                row[system_col],
+                jumps_value
+            ])
+            jump_cells.append(jumps_value)
+
+        parsed['jumps_left'] = _sum_jumps(jump_cells)
+
+    def _parse_fleetcarrier_csv(self, parsed, rows, cols, column_index):
+        """Fleet carrier route, as exported by Spansh and saved by GalaxyGPS after a restart."""
+        parsed['fleetcarrier'] = True
+        parsed['has_fuel_used'] = 'fuel used' in column_index
+        system_col = cols['system']
+        arrival_col = cols['distance to arrival']
+        distance_col = cols['distance']
+        remaining_col = cols['distance remaining']
+        tritium_tank_col = cols['tritium in tank']
+        tritium_market_col = cols['tritium in market']
+        fuel_used_col = cols['fuel used']
+        icy_ring_col = cols['icy ring']
+        pristine_col = cols['pristine']
+        restock_col = cols['restock']
+        append_full = parsed['route_full_data'].append
+        append_route = parsed['route'].append
+        jump_total = 0
+
+        for row in rows:
+            # Store full row data (all columns)
+            append_full(_RouteRow(row, column_index))
+            
+            # Store minimal route data for route planner
+            # Fleet Carrier format: [System Name, Distance, Distance Remaining, Tritium in tank, Tritium in market, Fuel Used, Icy Ring, Pristine, Restock Tritium]
+            # Columns missing from the file read as '' (see read_rows), so no per-column checks are needed
+            append_route([
+                row[system_col],                                           # 0: System Name
+                _round_distance(row[arrival_col] or row[distance_col]),    # 1: Distance
+                _round_distance(row[remaining_col]),                       # 2: Distance Remaining
+                row[tritium_tank_col],                                     # 3: Tritium in tank
+                row[tritium_market_col],                                   # 4: Tritium in market
+                _round_distance(row[fuel_used_col]),                       # 5: Fuel Used
+                row[icy_ring_col],                                         # 6: Icy Ring
+                row[pristine_col],                                         # 7: Pristine
+                row[restock_col],                                          # 8: Restock Tritium
+            ])
+            # Each fleet carrier row is 1 jump
+            jump_total += 1
+
+        parsed['jumps_left'] = jump_total
+
+    def _parse_galaxy_csv(self, parsed, rows, cols, column_index):
+        """Galaxy plotter route: [System Name, Refuel, Distance, Distance Remaining, Fuel Left, Fuel Used]"""
+        parsed['galaxy'] = True
+        parsed['has_fuel_used'] = 'fuel used' in column_index
+        system_col = cols['system']
+        refuel_col = cols['refuel']
+        arrival_col = cols['distance to arrival']
+        distance_col = cols['distance']
+        remaining_col = cols['distance remaining']
+        fuel_left_col = cols['fuel left']
+        fuel_used_col = cols['fuel used']
+        append_full = parsed['route_full_data'].append
+        append_route = parsed['route'].append
+        has_fuel_used = parsed['has_fuel_used']
+        distance_cols = [i for name, i in column_index.items() if name in ("distance to arrival", "distance remaining", "distance")]
+        jump_total = 0
+
+        for row in rows:
+            # Store full row data (all columns)
+            for i in distance_cols:
+                # Round distance values if present
+                if row[i]:
+                    row[i] = _round_distance(row[i])
+            append_full(_RouteRow(row, column_index))
+            
+            # Store minimal route data for route planner (distance cells were rounded above)
+            dist_to_arrival = row[arrival_col] or row[distance_col] or ''
+            dist_remaining = row[remaining_col] or ''
+
+            route_row = [
+                row[system_col],
+                row[refuel_col]
+            ]
+
+            if dist_to_arrival or dist_remaining:
+                route_row.append(dist_to_arrival)
+                route_row.append(dist_remaining)
+                
+                # Store Fuel Left at index 4 (round UP to nearest hundredth), '' if the file has no Fuel Left column
+                route_row.append(_round_distance(row[fuel_left_col]))
+            
+            # Store Fuel Used if present at index 5 (round UP to nearest hundredth)
+            if has_fuel_used:
+                route_row.append(_round_distance(row[fuel_used_col]))
 
+            append_route(route_row)
+            jump_total += 1
+
+        parsed['jumps_left'] = jump_total
+
+    def _parse_generic_csv(self, parsed, rows, cols, column_index):
+        """Any other route CSV: fleet carrier layout if it has Icy Ring/Pristine, else [System, Jumps, Fuel Used?]"""
+        # Generic CSV import - check if it's a fleet carrier route with Icy Ring/Pristine
+        if 'icy ring' in column_index or 'pristine' in column_index:
+            parsed['fleetcarrier'] = True
+        is_fleetcarrier = parsed['fleetcarrier']
+        
+        # Check if Fuel Used column exists
+        parsed['has_fuel_used'] = 'fuel used' in column_index
+        system_col = cols['system']
+        jumps_col = cols['jumps']
+        arrival_col = cols['distance to arrival']
+        distance_col = cols['distance']
+        remaining_col = cols['distance remaining']
+        tritium_tank_col = cols['tritium in tank']
+        tritium_market_col = cols['tritium in market']
+        fuel_used_col = cols['fuel used']
+        icy_ring_col = cols['icy ring']
+        pristine_col = cols['pristine']
+        restock_col = cols['restock']
+        append_full = parsed['route_full_data'].append
+        append_route = parsed['route'].append
+        has_fuel_used = parsed['has_fuel_used']
+        distance_cols = [i for name, i in column_index.items() if name in ("distance to arrival", "distance remaining", "distance")]
+        jump_total = 0
+        jump_cells = []
+
+        for row in rows:
+            # Store full row data (all columns) - preserve everything
+            for i in distance_cols:
+                # Round distance values if present
+                if row[i]:
+                    row[i] = _round_distance(row[i])
+            append_full(_RouteRow(row, column_index))
+            
+            # Store minimal route data for route planner
+            system = row[system_col]
+            
+            # For fleet carrier routes, use the new format
+            if is_fleetcarrier:
+                # Fleet Carrier format: [System Name, Distance, Distance Remaining, Tritium in tank, Tritium in market, Fuel Used, Icy Ring, Pristine, Restock Tritium]
+                # Distance cells were already rounded in place above; missing columns read as ''
+                append_route([
+                    system,                                                    # 0: System Name
+                    row[arrival_col] or row[distance_col] or '',               # 1: Distance
+                    row[remaining_col] or '',                                  # 2: Distance Remaining
+                    row[tritium_tank_col],                                     # 3: Tritium in tank
+                    row[tritium_market_col],                                   # 4: Tritium in market
+                    _round_distance(row[fuel_used_col]),                       # 5: Fuel Used
+                    row[icy_ring_col],                                         # 6: Icy Ring
+                    row[pristine_col],                                         # 7: Pristine
+                    row[restock_col],                                          # 8: Restock Tritium
+                ])
+                jump_total += 1
             else:
-                # Generic CSV import - check if it's a fleet carrier route with Icy Ring/Pristine
-                has_icy_ring_in_file = has_field('Icy Ring')
-                has_pristine_in_file = has_field('Pristine')
-                if has_icy_ring_in_file or has_pristine_in_file:
-                    self.fleetcarrier = True
+                # Generic route format: [System, Jumps, Fuel Used?, ...]
+                jumps = row[jumps_col]
+                route_entry = [system, jumps]
                 
-                # Check if Fuel Used column exists
-                self.has_fuel_used = has_field('Fuel Used')
+                # Add Fuel Used if present (round UP to nearest hundredth)
+                if has_fuel_used:
+                    route_entry.append(_round_distance(row[fuel_used_col]))
                 
-                for row in route_reader:
-                    if row not in (None, "", []):
-                        # Store full row data (all columns) - preserve everything
-                        full_row_data = {}
-                        for field_name in fieldnames:
-                            field_value = get_field(row, field_name, '')
-                            # Round distance values if present
-                            if field_name.lower() in ["distance to arrival", "distance remaining", "distance"]:
-                                if field_value:
-                                    try:
-                                        val = float(field_value)
-                                        rounded_val = math.ceil(val * 100) / 100
-                                        field_value = f"{rounded_val:.2f}"
-                                    except (ValueError, TypeError):
-                                        pass
-                            full_row_data[field_name.lower()] = field_value
-                        self.route_full_data.append(full_row_data)
-                        
-                        # Store minimal route data for route planner
-                        system = get_field(row, self.system_header, "")
-                        
-                        # For fleet carrier routes, use the new format
-                        if self.fleetcarrier:
-                            # Fleet Carrier format: [System Name, Distance, Distance Remaining, Tritium in tank, Tritium in market, Fuel Used, Icy Ring, Pristine, Restock Tritium]
-                            dist_to_arrival, dist_remaining = get_distance_fields(row)
-                            route_entry = [
-                                system,                                            # 0: System Name
-                                dist_to_arrival if dist_to_arrival else "",        # 1: Distance
-                                dist_remaining if dist_remaining else "",          # 2: Distance Remaining
-                                get_field(row, 'Tritium in tank', ''),            # 3: Tritium in tank
-                                get_field(row, 'Tritium in market', ''),          # 4: Tritium in market
-                            ]
-                            
-                            # Add Fuel Used if present (round UP to nearest hundredth)
-                            if self.has_fuel_used:
-                                fuel_used_raw = get_field(row, 'Fuel Used', '')
-                                if fuel_used_raw:
-                                    try:
-                                        val = float(fuel_used_raw)
-                                        rounded_val = math.ceil(val * 100) / 100
-                                        route_entry.append(f"{rounded_val:.2f}")   # 5: Fuel Used
-                                    except (ValueError, TypeError):
-                                        route_entry.append(fuel_used_raw)
-                                else:
-                                    route_entry.append('')
-                            else:
-                                route_entry.append('')  # 5: Fuel Used placeholder
-                            
-                            # Add Icy Ring and Pristine if present
-                            if has_icy_ring_in_file:
-                                route_entry.append(get_field(row, 'Icy Ring', ''))  # 6: Icy Ring
-                            else:
-                                route_entry.append('')
-                            
-                            if has_pristine_in_file:
-                                route_entry.append(get_field(row, 'Pristine', ''))  # 7: Pristine
-                            else:
-                                route_entry.append('')
-                            
-                            route_entry.append(get_field(row, self.restocktritium_header, ''))  # 8: Restock Tritium
-                            
-                            self.route.append(route_entry)
-                            self.jumps_left += 1
-                        else:
-                            # Generic route format: [System, Jumps, Fuel Used?, ...]
-                            jumps = get_field(row, self.jumps_header, "")
-                            route_entry = [system, jumps]
-                            
-                            # Add Fuel Used if present (round UP to nearest hundredth)
-                            if self.has_fuel_used:
-                                fuel_used_raw = get_field(row, 'Fuel Used', '')
-                                if fuel_used_raw:
-                                    try:
-                                        val = float(fuel_used_raw)
-                                        rounded_val = math.ceil(val * 100) / 100
-                                        route_entry.append(f"{rounded_val:.2f}")
-                                    except (ValueError, TypeError):
-                                        route_entry.append(fuel_used_raw)
-                                else:
-                                    route_entry.append('')
-                            
-                            self.route.append(route_entry)
-                            try:
-                                self.jumps_left += int(jumps) if jumps else 0
-                            except (ValueError, TypeError):
-                                pass
+                append_route(route_entry)
+                jump_cells.append(jumps)
 
-            if self.route:
-                # Find where we are in the route based on current system location
-                self.offset = self.find_current_waypoint_in_route()
-                
-                self.next_stop = self.route[self.offset][0]
-                self.update_bodies_text()  # Update bodies text for Road to Riches routes
-                self.compute_distances()
-                self.update_gui()
-                # Check fleet carrier restock warning
-                if self.fleetcarrier and hasattr(self, 'check_fleet_carrier_restock_warning'):
-                    self.check_fleet_carrier_restock_warning()
+        parsed['jumps_left'] = jump_total + _sum_jumps(jump_cells)
+
+    def _get_spansh_session(self):
+        """Return the pooled Spansh session, creating it on first use."""
+        if self._spansh_session is None:
+            session = timeout_session.new_session()
+            session.headers['User-Agent'] = user_agent + ' GalaxyGPS'
+            # Retry idempotent requests (the result polls) once on a bad gateway only; 503/504 and
+            # Retry-After are left to the deadline-bounded poll loop, and read timeouts are not retried.
+            # The route submit is a POST and is never retried automatically.
+            retry = Retry(total=1, read=0, backoff_factor=0.2, status_forcelist=(502,),
+                          respect_retry_after_header=False, raise_on_status=False)
+            session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+            self._spansh_session = session
+        return self._spansh_session
 
     def _run_plot_route_worker(self, source, dest, efficiency, range_ly, supercharge_multiplier):
         """Worker: run Spansh HTTP + poll + parse off main thread, put result in queue."""
@@ -2791,11 +2958,41 @@ class GalaxyGPS():
             self._route_queue.put({
                 'ok': False, 'error': err, 'source_red': source_red, 'dest_red': dest_red,
             })
+            self._notify_main_thread(ROUTE_READY_EVENT)
+
+        def put_failure(response):
+            # A 400 carries Spansh's message, which names the system it could not resolve
+            try:
+                failure = _json_loads(response.content)
+            except (json.JSONDecodeError, ValueError):
+                failure = {}
+            if response.status_code == 400 and "error" in failure:
+                err = failure["error"]
+                put_error(err, SPANSH_ERR_SOURCE in err, SPANSH_ERR_DEST in err)
+            else:
+                put_error(self.plot_error)
+
+        def put_result(result):
+            # Hand out copies so the cached route is never edited through self.route
+            self._route_queue.put({
+                'ok': True,
+                'route': [list(row) for row in result['route']],
+                'route_full_data': [dict(row) for row in result['route_full_data']],
+                'route_fieldnames': list(result['route_fieldnames']),
+                'jumps_left': result['jumps_left'],
+            })
+            self._notify_main_thread(ROUTE_READY_EVENT)
+
+        cache_key = (source.lower(), dest.lower(), efficiency, range_ly, supercharge_multiplier)
+        cached = self._spansh_route_cache.get(cache_key)
+        if cached and monotonic() - cached[0] < SPANSH_ROUTE_CACHE_TTL:
+            logger.debug(f"Reusing cached Spansh route for {source} -> {dest}")
+            put_result(cached[1])
+            return
 
         try:
             job_url = "https://spansh.co.uk/api/route?"
-            session = timeout_session.new_session()
-            session.headers['User-Agent'] = user_agent + ' GalaxyGPS'
+            session = self._get_spansh_session()
             try:
                 results = session.post(
                     job_url,
@@ -2818,18 +3015,11 @@ class GalaxyGPS():
                     f"Failed to query plotted route from Spansh: "
                     f"{results.status_code}; text: {results.text}"
                 )
-                try:
-                    failure = json.loads(results.content)
-                except (json.JSONDecodeError, ValueError):
-                    failure = {}
-                err = failure.get("error", self.plot_error) if results.status_code == 400 else self.plot_error
-                source_red = bool(results.status_code == 400 and "error" in failure and "starting system" in failure["error"])
-                dest_red = bool(results.status_code == 400 and "error" in failure and "finishing system" in failure["error"])
-                put_error(err, source_red, dest_red)
+                put_failure(results)
                 return
 
             try:
-                response = json.loads(results.content)
+                response = _json_loads(results.content)
             except (json.JSONDecodeError, ValueError) as e:
                 logger.warning(f"Failed to parse Spansh response: {e}")
                 put_error("Invalid response from Spansh. Please try again.")
@@ -2841,9 +3031,10 @@ class GalaxyGPS():
                 put_error("Failed to start route calculation. Please try again.")
                 return
 
-            tries = 0
             route_response = None
-            while tries < 20:
+            delay = SPANSH_POLL_INITIAL_DELAY
+            deadline = monotonic() + SPANSH_POLL_TIMEOUT
+            while monotonic() < deadline:
                 try:
                     route_response = session.get(
                         f"https://spansh.co.uk/api/results/{job}",
@@ -2853,10 +3044,15 @@ class GalaxyGPS():
                     logger.warning(f"Error polling Spansh results: {e}")
                     route_response = None
                     break
-                if route_response.status_code != 202:
+                if route_response.status_code not in SPANSH_POLL_AGAIN_STATUSES:
                     break
-                tries += 1
-                sleep(1)
+                # Back off from a short first wait so quick jobs return fast, honouring Retry-After
+                try:
+                    wait = float(route_response.headers.get('Retry-After', delay))
+                except (TypeError, ValueError):
+                    wait = delay
+                sleep(max(0.0, min(wait, deadline - monotonic())))
+                delay = min(delay * 1.5, SPANSH_POLL_MAX_DELAY)
 
             if not route_response:
                 logger.warning("Query to Spansh timed out")
@@ -2865,18 +3061,20 @@ class GalaxyGPS():
 
             if route_response.status_code == 200:
                 try:
-                    response_data = json.loads(route_response.content)
+                    response_data = _json_loads(route_response.content)
                     if "result" not in response_data or "system_jumps" not in response_data["result"]:
                         logger.warning(f"Unexpected Spansh response structure: {response_data}")
                         put_error("Invalid route data from Spansh. Please try again.")
                         return
                     route = response_data["result"]["system_jumps"]
+                    # Only the waypoint list is used; let the rest of the decoded body go
+                    del response_data
                 except (json.JSONDecodeError, ValueError, KeyError) as e:
                     logger.warning(f"Invalid data from Spansh: {e}")
                     put_error(self.plot_error)
                     return
 
-                if not route or len(route) == 0:
+                if not route:
                     logger.warning("Empty route returned from Spansh")
                     put_error("No route found between the specified systems.")
                     return
@@ -2885,6 +3083,10 @@ class GalaxyGPS():
                 route_full_data = []
                 route_fieldnames = ['System Name', 'Jumps', 'Distance To Arrival', 'Distance Remaining']
                 jumps_left = 0
+                fieldnames_seen = set(route_fieldnames)
+                # Raw Spansh key -> (full data key, display column name); None for the fixed columns.
+                # Filled as keys are first seen, so the string work is done once per key, not per waypoint.
+                key_names = dict.fromkeys(('system', 'jumps', 'distance_jumped', 'distance_left'))
                 for waypoint in route:
                     system = waypoint.get("system", "")
                     jumps = waypoint.get("jumps", 0)
@@ -2898,59 +3100,78 @@ class GalaxyGPS():
                         'distance remaining': distance_remaining,
                     }
                     for key, value in waypoint.items():
-                        if key not in ['system', 'jumps', 'distance_jumped', 'distance_left']:
-                            field_name = key.lower().replace('_', ' ')
-                            full_row_data[field_name] = str(value) if value else ''
-                            display_name = key.replace('_', ' ').title()
-                            if display_name not in route_fieldnames:
-                                route_fieldnames.append(display_name)
+                        try:
+                            names = key_names[key]
+                        except KeyError:
+                            names = key_names[key] = (key.lower().replace('_', ' '), key.replace('_', ' ').title())
+                            if names[1] not in fieldnames_seen:
+                                fieldnames_seen.add(names[1])
+                                route_fieldnames.append(names[1])
+                        if names is not None:
+                            full_row_data[names[0]] = str(value) if value else ''
                     route_full_data.append(full_row_data)
                     try:
                         jumps_left += int(jumps)
                     except (ValueError, TypeError):
                         pass
 
-                if len(route_rows) == 0:
-                    put_error("Failed to process route data. Please try again.")
-                    return
-
-                self._route_queue.put({
-                    'ok': True,
+                result = {
                     'route': route_rows,
                     'route_full_data': route_full_data,
                     'route_fieldnames': route_fieldnames,
                     'jumps_left': jumps_left,
-                })
+                }
+                now = monotonic()
+                for key in [k for k, (stamp, _) in self._spansh_route_cache.items() if now - stamp >= SPANSH_ROUTE_CACHE_TTL]:
+                    self._spansh_route_cache.pop(key, None)
+                self._spansh_route_cache[cache_key] = (now, result)
+                put_result(result)
                 return
 
             logger.warning(
                 f"Failed final route fetch: {route_response.status_code}; "
                 f"text: {route_response.text}"
             )
-            try:
-                failure = json.loads(route_response.content)
-            except (json.JSONDecodeError, ValueError):
-                failure = {}
-            err = self.plot_error
-            source_red = dest_red = False
-            if route_response.status_code == 400 and "error" in failure:
-                err = failure["error"]
-                source_red = "starting system" in failure["error"]
-                dest_red = "finishing system" in failure["error"]
-            put_error(err, source_red, dest_red)
+            put_failure(route_response)
 
         except Exception:
             logger.warning('!! ' + traceback.format_exc(), exc_info=False)
             put_error(self.plot_error)
 
-    def _poll_route_result(self):
-        """Main-thread polling: when worker puts result, apply it and update UI."""
+    def _notify_main_thread(self, event):
+        """Worker side: wake the main thread to apply a queued result via a bound virtual event."""
+        if getattr(config, 'shutting_down', False):
+            return
+        try:
+            # event_generate with when='tail' is the thread-safe way to reach the Tk main loop
+            self.frame.event_generate(event, when='tail')
+        except Exception:
+            logger.warning('!! ' + traceback.format_exc(), exc_info=False)
+
+    def _schedule_refresh(self, key, fn):
+        """
+        Run a display refresh shortly, coalescing repeat requests for the same key.
+        Journal events arrive in bursts; each burst then costs one redraw per display.
+        """
+        if key in self._pending_refresh:
+            return
+        if not getattr(self, 'frame', None):
+            fn()
+            return
+
+        def run():
+            self._pending_refresh.pop(key, None)
+            fn()
+
+        self._pending_refresh[key] = self.frame.after(DISPLAY_REFRESH_DELAY_MS, run)
+
+    def _apply_route_result(self, event=None):
+        """Main thread: apply the result the route worker queued and update UI."""
         if getattr(config, 'shutting_down', False):
             return
         try:
             r = self._route_queue.get_nowait()
         except queue.Empty:
-            self.frame.after(200, self._poll_route_result)
             return
 
         self.enable_plot_gui(True)
@@ -2967,6 +3188,8 @@ class GalaxyGPS():
         self.route_full_data = r['route_full_data']
         self.route_fieldnames = r['route_fieldnames']
         self.jumps_left = r['jumps_left']
+        self._rebuild_jumps_prefix()
+        self._rebuild_system_body_counts()
 
         self.show_plot_gui(False)
         current_system = monitor.state.get('SystemName') if monitor and hasattr(monitor, 'state') else None
@@ -2979,7 +3202,7 @@ class GalaxyGPS():
         self.compute_distances()
         self.copy_waypoint()
         self.update_gui()
-        self.refresh_route_window_if_open()
+        self._schedule_refresh('route', self.refresh_route_window_if_open)
         if self.fleetcarrier and hasattr(self, 'check_fleet_carrier_restock_warning'):
             self.check_fleet_carrier_restock_warning()
         self.save_all_route()
@@ -3009,40 +3232,46 @@ class GalaxyGPS():
 
         supercharge_multiplier = 6 if self.supercharge_overcharge.get() else 4
         self.enable_plot_gui(False)
+        # Bound here rather than at frame creation so a rebuilt frame still gets the result
+        self.frame.bind(ROUTE_READY_EVENT, self._apply_route_result)
         threading.Thread(
             target=self._run_plot_route_worker,
             args=(source, dest, efficiency, range_ly, supercharge_multiplier),
             daemon=True,
         ).start()
-        self.frame.after(200, self._poll_route_result)
 
     def plot_edts(self, filename):
         try:
             with open(filename, 'r') as txtfile:
-                route_txt = txtfile.readlines()
                 self.clear_route(False)
-                for row in route_txt:
-                    if row not in (None, "", []):
-                        if row.lstrip().startswith('==='):
-                            jumps = int(re.findall(r"\d+ jump", row)[0].rstrip(' jumps'))
+                # Stream the file; only "===" lines carry route legs
+                for row in txtfile:
+                    if not row.lstrip().startswith('==='):
+                        continue
+                    match = _EDTS_JUMPS_RE.search(row)
+                    if not match:
+                        continue
+                    jumps = int(match.group(1))
+                    self.jumps_left += jumps
+
+                    system = row[row.find('>') + 1:]
+                    if ',' in system:
+                        systems = system.split(',')
+                        for system in systems:
+                            self.route.append([system.strip(), jumps])
+                            jumps = 1
                             self.jumps_left += jumps
-
-                            system = row[row.find('>') + 1:]
-                            if ',' in system:
-                                systems = system.split(',')
-                                for system in systems:
-                                    self.route.append([system.strip(), jumps])
-                                    jumps = 1
-                                    self.jumps_left += jumps
-                            else:
-                                self.route.append([system.strip(), jumps])
+                    else:
+                        self.route.append([system.strip(), jumps])
+                self._rebuild_jumps_prefix()
+                self._rebuild_system_body_counts()
         except Exception:
             logger.warning('!! ' + traceback.format_exc(), exc_info=False)
             self.enable_plot_gui(True)
             self.show_error("(2) An error occured while reading the file.")
 
     def export_route(self):
-        if len(self.route) == 0:
+        if not self.route:
             logger.debug("No route to export")
             return
 
@@ -3054,11 +3283,10 @@ class GalaxyGPS():
         ftypes = [('TCE Flight Plan files', '*.exp')]
         filename = filedialog.asksaveasfilename(filetypes = ftypes, initialdir=os.path.expanduser('~'), initialfile=f"{route_name}.exp")
 
-        if filename.__len__() > 0:
+        if filename:
             try:
                 with open(filename, 'w') as csvfile:
-                    for row in self.route:
-                        csvfile.write(f"{route_name},{row[0]}\n")
+                    csvfile.writelines(f"{route_name},{row[0]}\n" for row in self.route)
             except Exception:
                 logger.warning('!! ' + traceback.format_exc(), exc_info=False)
                 self.show_error("An error occured while writing the file.")
@@ -3070,6 +3298,9 @@ class GalaxyGPS():
         if clear:
             self.offset = 0
             self.route = []
+            self._jumps_prefix = []
+            self._system_body_counts = Counter()
+            self._last_restock_state = None
             self.route_full_data = []  # Clear full CSV data
             self.route_fieldnames = []  # Clear fieldnames
             self.next_waypoint = ""
@@ -3079,14 +3310,8 @@ class GalaxyGPS():
             self.galaxy = False
             self.neutron = False
             self.original_csv_path = None  # Clear original CSV path reference
-            try:
-                os.remove(self.save_route_path)
-            except (IOError, OSError):
-                logger.debug("No route to delete")
-            try:
-                os.remove(self.offset_file_path)
-            except (IOError, OSError):
-                logger.debug("No offset file to delete")
+            _remove_file(self.save_route_path)
+            _remove_file(self.offset_file_path)
 
             self.update_gui()
 
@@ -3100,26 +3325,22 @@ class GalaxyGPS():
         Uses route_full_data if available to preserve ALL original columns,
         otherwise falls back to saving self.route with appropriate headers.
         """
-        if len(self.route) == 0:
-            try:
-                os.remove(self.save_route_path)
-            except (IOError, OSError):
-                pass
+        if not self.route:
+            _remove_file(self.save_route_path)
             return
 
         try:
             # PRIORITY 1: Use route_full_data if available (preserves ALL original columns)
             if self.route_full_data and len(self.route_full_data) > 0 and self.route_fieldnames:
                 with open(self.save_route_path, 'w', encoding='utf-8-sig', newline='') as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=self.route_fieldnames)
-                    writer.writeheader()
-                    for row_data in self.route_full_data:
-                        # Convert lowercase keys back to original fieldnames for writing
-                        row_to_write = {}
-                        for original_fieldname in self.route_fieldnames:
-                            lowercase_key = original_fieldname.lower()
-                            row_to_write[original_fieldname] = row_data.get(lowercase_key, '')
-                        writer.writerow(row_to_write)
+                    writer = csv.writer(csvfile)
+                    writer.writerow(self.route_fieldnames)
+                    # Rows are keyed by lowercase fieldname; look each column up in header order
+                    lowercase_keys = [fieldname.lower() for fieldname in self.route_fieldnames]
+                    writer.writerows(
+                        [row_data.get(key, '') for key in lowercase_keys]
+                        for row_data in self.route_full_data
+                    )
                 return
 
             # FALLBACK: Use self.route with appropriate headers based on route type
@@ -3197,9 +3418,11 @@ class GalaxyGPS():
 
             # --- Standard route (from Spansh API) ---
             # Default format for routes calculated via API - has System Name, Jumps, Distance To Arrival, Distance Remaining
-            if len(self.route) > 0 and len(self.route[0]) >= 2:
+            # The route is non-empty here (checked on entry)
+            first_row_len = len(self.route[0])
+            if first_row_len >= 2:
                 # Check if this is a neutron route format (5 columns) or standard API route (4 columns)
-                is_neutron_format = len(self.route[0]) >= 5
+                is_neutron_format = first_row_len >= 5
                 
                 if is_neutron_format:
                     # Neutron route format
@@ -3258,18 +3481,15 @@ class GalaxyGPS():
 
 
     def save_offset(self):
-        if len(self.route) != 0:
+        if self.route:
             with open(self.offset_file_path, 'w') as offset_fh:
                 offset_fh.write(str(self.offset))
         else:
-            try:
-                os.remove(self.offset_file_path)
-            except (IOError, OSError):
-                logger.debug("No offset to delete")
+            _remove_file(self.offset_file_path)
 
     def update_bodies_text(self):
         if not self.roadtoriches: 
-            logger.debug(f"[update_bodies_text] Not a Road to Riches route, skipping")
+            logger.debug("[update_bodies_text] Not a Road to Riches route, skipping")
             return
 
         # For the bodies to scan use the current system, which is one before the next stop
@@ -3277,7 +3497,7 @@ class GalaxyGPS():
         if lastsystemoffset < 0:
             lastsystemoffset = 0 # Display bodies of the first system
 
-        logger.debug(f"[update_bodies_text] lastsystemoffset={lastsystemoffset}, route length={len(self.route)}")
+        logger.debug("[update_bodies_text] lastsystemoffset=%s, route length=%s", lastsystemoffset, len(self.route))
 
         # Validate that the route entry has the required indices for Road to Riches
         # Road to Riches routes should have: [0]=system, [1]=jumps, [2]=bodynames, [3]=bodysubtypes
@@ -3291,21 +3511,16 @@ class GalaxyGPS():
         # Get the system name to count bodies for
         lastsystem = route_entry[0] if len(route_entry) > 0 else None
         if not lastsystem:
-            logger.debug(f"[update_bodies_text] No system name at offset {lastsystemoffset}")
+            logger.debug("[update_bodies_text] No system name at offset %s", lastsystemoffset)
             self.bodies = ""
             return
         
-        logger.debug(f"[update_bodies_text] Counting bodies for system: {lastsystem}")
+        logger.debug("[update_bodies_text] Counting bodies for system: %s", lastsystem)
         
-        # Count how many rows in the route have the same system name as lastsystem
-        body_count = 0
-        for row in self.route:
-            if len(row) > 0:
-                system_name = row[0] if row[0] else ""
-                if system_name and system_name.lower() == lastsystem.lower():
-                    body_count += 1
+        # Number of rows in the route with the same system name as lastsystem
+        body_count = self._system_body_counts[lastsystem.lower()]
         
-        logger.debug(f"[update_bodies_text] Body count for {lastsystem}: {body_count}")
+        logger.debug("[update_bodies_text] Body count for %s: %s", lastsystem, body_count)
         
         # Display the count
         if body_count > 0:
@@ -3316,7 +3531,7 @@ class GalaxyGPS():
         if len(route_entry) < 4:
             # Road to Riches route entry doesn't have bodynames/bodysubtypes
             # This can happen with external Road to Riches CSVs that have a different structure
-            logger.debug(f"[update_bodies_text] Route entry too short ({len(route_entry)}), showing count only")
+            logger.debug("[update_bodies_text] Route entry too short (%s), showing count only", len(route_entry))
             self.bodies = bodies_text  # Just show the count
             return
 
@@ -3338,14 +3553,11 @@ class GalaxyGPS():
         # Handle empty lists
         if len(bodynames) == 0 or len(bodysubtypes) == 0:
             self.bodies = f"{bodies_text}\n{lastsystem}: (no bodies)"
-            logger.debug(f"[update_bodies_text] No bodies in lists, result: {self.bodies}")
+            logger.debug("[update_bodies_text] No bodies in lists, result: %s", self.bodies)
             return
      
-        waterbodies = []
-        rockybodies = []
-        metalbodies = []
-        earthlikebodies = []
-        unknownbodies = []
+        buckets = [[], [], [], [], []]
+        prefix = lastsystem + " "
 
         for num, name in enumerate(bodysubtypes):
             # Ensure we don't go out of bounds
@@ -3356,22 +3568,12 @@ class GalaxyGPS():
             try:
                 body_name = str(bodynames[num]) if bodynames[num] else ""
                 subtype_name = str(name) if name else ""
-                shortbodyname = body_name.replace(lastsystem + " ", "")
-                
-                if subtype_name.lower() == "high metal content world":
-                    metalbodies.append(shortbodyname)
-                elif subtype_name.lower() == "rocky body": 
-                    rockybodies.append(shortbodyname)
-                elif subtype_name.lower() == "earth-like world":
-                    earthlikebodies.append(shortbodyname)
-                elif subtype_name.lower() == "water world": 
-                    waterbodies.append(shortbodyname)
-                else:
-                    unknownbodies.append(shortbodyname)
+                buckets[_SUBTYPE_BUCKET.get(subtype_name.lower(), 4)].append(body_name.replace(prefix, ""))
             except Exception as e:
                 logger.warning(f'[update_bodies_text] Error processing body {num} at offset {lastsystemoffset}: {e}', exc_info=False)
                 continue
 
+        metalbodies, rockybodies, earthlikebodies, waterbodies, unknownbodies = buckets
         bodysubtypeandname = ""
         if len(metalbodies) > 0: bodysubtypeandname += f"\n   Metal: " + ', '.join(metalbodies)
         if len(rockybodies) > 0: bodysubtypeandname += f"\n   Rocky: " + ', '.join(rockybodies)
@@ -3380,12 +3582,12 @@ class GalaxyGPS():
         if len(unknownbodies) > 0: bodysubtypeandname += f"\n   Unknown: " + ', '.join(unknownbodies)
 
         self.bodies = f"{bodies_text}\n{lastsystem}:{bodysubtypeandname}"
-        logger.debug(f"[update_bodies_text] Final self.bodies: {self.bodies[:100]}...")
+        logger.debug("[update_bodies_text] Final self.bodies: %s...", self.bodies[:100])
 
 
     def check_range(self, name, index, mode):
         value = self.range_entry.var.get()
-        if value.__len__() > 0 and value != self.range_entry.placeholder:
+        if value and value != self.range_entry.placeholder:
             try:
                 float(value)
                 self.range_entry.set_error_style(False)
@@ -3417,7 +3619,7 @@ class GalaxyGPS():
             session.headers['User-Agent'] = user_agent + ' GalaxyGPS'
             response = session.get(url, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 tag_name = data.get("tag_name") or ""
                 # Normalize: tag may be "1.5.1" or "v1.5.1"
                 remote_version = tag_name.lstrip("vV").strip()
@@ -3452,12 +3654,18 @@ class GalaxyGPS():
         """
         Get all fleet carriers stored in CSV.
         
+        The list is reused until the manager's version changes, so callers must not modify it.
+        
         Returns:
             List of carrier dictionaries
         """
-        if self.fleet_carrier_manager:
-            return self.fleet_carrier_manager.get_all_carriers()
-        return []
+        manager = self.fleet_carrier_manager
+        if not manager:
+            return []
+        if self._carriers_cache is None or self._carriers_cache_version != manager.version:
+            self._carriers_cache = manager.get_all_carriers()
+            self._carriers_cache_version = manager.version
+        return self._carriers_cache
     
     def update_fleet_carrier_dropdown(self):
         """
@@ -3466,22 +3674,19 @@ class GalaxyGPS():
         if not self.fleet_carrier_combobox:
             return
         
+        # Values are rebuilt, so the next selection always refreshes the displays
+        self._last_selected_callsign = None
         try:
             carriers = self.get_all_fleet_carriers()
             if carriers:
-                # Create display strings for dropdown
-                carrier_options = []
-                for carrier in sorted(carriers, key=lambda x: x.get('last_updated', ''), reverse=True):
-                    callsign = carrier.get('callsign', 'Unknown')
-                    name = carrier.get('name', '')
-                    system = carrier.get('current_system', 'Unknown')
-                    fuel = carrier.get('fuel', '0')
-                    
-                    display_name = f"{name} ({callsign})" if name else callsign
-                    display_text = f"{display_name} | {system} | Tritium: {fuel}"
-                    carrier_options.append(display_text)
+                # Create display strings for dropdown, most recently updated first.
+                # sorted() rather than sort(): the list may be the shared per-event carrier cache.
+                ordered = sorted(carriers, key=itemgetter('last_updated'), reverse=True)
+                carrier_options = [_carrier_option_text(carrier) for carrier in ordered]
                 
                 self.fleet_carrier_combobox['values'] = carrier_options
+                self._option_callsigns = [carrier.get('callsign', 'Unknown') for carrier in ordered]
+                self._callsign_to_index = {callsign: idx for idx, callsign in enumerate(self._option_callsigns)}
                 
                 # Set default selection to first (most recent) carrier
                 if carrier_options:
@@ -3495,28 +3700,30 @@ class GalaxyGPS():
                         if hasattr(self, 'update_fleet_carrier_system_display'):
                             self.update_fleet_carrier_system_display()
                         if hasattr(self, 'update_fleet_carrier_balance_display'):
-                            self.update_fleet_carrier_balance_display()
+                            self._schedule_refresh('balance', self.update_fleet_carrier_balance_display)
                         if hasattr(self, 'update_fleet_carrier_tritium_display'):
-                            self.update_fleet_carrier_tritium_display()
+                            self._schedule_refresh('tritium', self.update_fleet_carrier_tritium_display)
                         if hasattr(self, 'update_fleet_carrier_rings_status'):
                             self.update_fleet_carrier_rings_status()
                     # Enable Inara button if carrier is selected
-                    if self.fleet_carrier_inara_btn:
-                        self.fleet_carrier_inara_btn.config(state=tk.NORMAL)
+                    _set_widget_state(self.fleet_carrier_inara_btn, tk.NORMAL)
             else:
                 self.fleet_carrier_combobox['values'] = ["No carrier data"]
+                self._option_callsigns = []
+                self._callsign_to_index = {}
                 self.fleet_carrier_combobox.current(0)
                 # Disable Inara button if no carrier data
-                if self.fleet_carrier_inara_btn:
-                    self.fleet_carrier_inara_btn.config(state=tk.DISABLED)
+                _set_widget_state(self.fleet_carrier_inara_btn, tk.DISABLED)
                 # Set displays to Unknown when no data
                 if hasattr(self, 'update_fleet_carrier_system_display'):
                     self.update_fleet_carrier_system_display()
                 if hasattr(self, 'update_fleet_carrier_balance_display'):
-                    self.update_fleet_carrier_balance_display()
+                    self._schedule_refresh('balance', self.update_fleet_carrier_balance_display)
         except Exception:
             logger.warning('!! Error updating fleet carrier dropdown: ' + traceback.format_exc(), exc_info=False)
             self.fleet_carrier_combobox['values'] = ["Error loading carrier data"]
+            self._option_callsigns = []
+            self._callsign_to_index = {}
     
     def on_carrier_selected(self, event=None):
         """
@@ -3527,9 +3734,9 @@ class GalaxyGPS():
             selection = self.fleet_carrier_var.get()
             if not selection or selection == "No carrier data" or selection == "Error loading carrier data":
                 self.selected_carrier_callsign = None
+                self._last_selected_callsign = None
                 # Disable Inara button if no carrier selected
-                if self.fleet_carrier_inara_btn:
-                    self.fleet_carrier_inara_btn.config(state=tk.DISABLED)
+                _set_widget_state(self.fleet_carrier_inara_btn, tk.DISABLED)
                 # Update warning check and system display
                 if hasattr(self, 'check_fleet_carrier_restock_warning'):
                     self.check_fleet_carrier_restock_warning()
@@ -3538,14 +3745,19 @@ class GalaxyGPS():
                 if hasattr(self, 'update_fleet_carrier_rings_status'):
                     self.update_fleet_carrier_rings_status()
                 if hasattr(self, 'update_fleet_carrier_balance_display'):
-                    self.update_fleet_carrier_balance_display()
+                    self._schedule_refresh('balance', self.update_fleet_carrier_balance_display)
                 return
             
-            # Extract callsign from selection (format: "Name (CALLSIGN) | System | ...")
-            # Try to find the callsign in parentheses
-            match = re.search(r'\(([A-Z0-9]+-[A-Z0-9]+)\)', selection)
-            if match:
-                self.selected_carrier_callsign = match.group(1)
+            # The callsign is recorded when the options are built; parse the text only
+            # if the selection is not one of those options
+            index = self.fleet_carrier_combobox.current()
+            if 0 <= index < len(self._option_callsigns):
+                callsign = self._option_callsigns[index]
+            else:
+                # Format: "Name (CALLSIGN) | System | ..." - try to find the callsign in parentheses
+                callsign = _extract_callsign(selection)
+            if callsign:
+                self.selected_carrier_callsign = callsign
             else:
                 # Fallback: try to extract from start if no name
                 parts = selection.split(' | ')
@@ -3560,10 +3772,28 @@ class GalaxyGPS():
                 self.fleet_carrier_var.set(simple_display)
             
             # Enable Inara button when carrier is selected
-            if self.fleet_carrier_inara_btn and self.selected_carrier_callsign:
-                self.fleet_carrier_inara_btn.config(state=tk.NORMAL)
+            if self.selected_carrier_callsign:
+                _set_widget_state(self.fleet_carrier_inara_btn, tk.NORMAL)
             
-                # Update warning check, system display, rings status, Tritium display, and balance display when carrier selection changes
+            # Re-selecting the carrier that is already shown needs no refresh
+            if self.selected_carrier_callsign == self._last_selected_callsign:
+                return
+            self._last_selected_callsign = self.selected_carrier_callsign
+            
+            # Refresh the carrier panel once the selection event is finished, so the dropdown
+            # closes first and several quick selections collapse into one refresh
+            if not self.frame:
+                self._refresh_carrier_panel()
+            elif not self._carrier_refresh_pending:
+                self._carrier_refresh_pending = True
+                self.frame.after_idle(self._refresh_carrier_panel)
+        except Exception:
+            logger.warning('!! Error handling carrier selection: ' + traceback.format_exc(), exc_info=False)
+    
+    def _refresh_carrier_panel(self):
+        """Update warning check, system display, rings status, Tritium display, and balance display for the selected carrier."""
+        self._carrier_refresh_pending = False
+        try:
             if hasattr(self, 'check_fleet_carrier_restock_warning'):
                 self.check_fleet_carrier_restock_warning()
             if hasattr(self, 'update_fleet_carrier_system_display'):
@@ -3575,7 +3805,7 @@ class GalaxyGPS():
             if hasattr(self, 'update_fleet_carrier_balance_display'):
                 self.update_fleet_carrier_balance_display()
         except Exception:
-            logger.warning('!! Error handling carrier selection: ' + traceback.format_exc(), exc_info=False)
+            logger.warning('!! Error refreshing fleet carrier panel: ' + traceback.format_exc(), exc_info=False)
     
     # _style_combobox_popup method removed - no longer needed with custom ThemedCombobox widget
     
@@ -3608,15 +3838,7 @@ class GalaxyGPS():
                 return
             
             # Find the matching carrier option in the dropdown
-            dropdown_values = self.fleet_carrier_combobox['values']
-            selected_index = None
-            
-            for idx, option in enumerate(dropdown_values):
-                # Extract callsign from option (format: "Name (CALLSIGN) | System | ...")
-                match = re.search(r'\(([A-Z0-9]+-[A-Z0-9]+)\)', option)
-                if match and match.group(1) == callsign:
-                    selected_index = idx
-                    break
+            selected_index = self._callsign_to_index.get(callsign)
             
             # If found, select it in the dropdown
             if selected_index is not None:
@@ -3630,12 +3852,10 @@ class GalaxyGPS():
                 # Update dropdown if we can find a match
                 self.update_fleet_carrier_dropdown()
                 # Find and set the current selection
-                for idx, option in enumerate(self.fleet_carrier_combobox['values']):
-                    match = re.search(r'\(([A-Z0-9]+-[A-Z0-9]+)\)', option)
-                    if match and match.group(1) == callsign:
-                        self.fleet_carrier_combobox.current(idx)
-                        self.on_carrier_selected()
-                        break
+                selected_index = self._callsign_to_index.get(callsign)
+                if selected_index is not None:
+                    self.fleet_carrier_combobox.current(selected_index)
+                    self.on_carrier_selected()
                 
         except Exception:
             logger.warning(f'!! Error selecting carrier {callsign} from details window: ' + traceback.format_exc(), exc_info=False)
@@ -3663,9 +3883,7 @@ class GalaxyGPS():
             # Fleet carriers are accessed via the station search endpoint
             # urllib.parse.quote() handles spaces, special chars, and unicode properly
             # e.g., "My Carrier" becomes "My%20Carrier"
-            encoded_callsign = urllib.parse.quote(callsign)
-            url = f"https://inara.cz/elite/station/?search={encoded_callsign}"
-            webbrowser.open(url)
+            webbrowser.open(_INARA_STATION_TMPL.format(_quote(callsign)))
         except Exception:
             logger.warning(f'!! Error opening Inara carrier page for {callsign}: ' + traceback.format_exc(), exc_info=False)
     
@@ -3682,9 +3900,7 @@ class GalaxyGPS():
             # Inara system URL format: https://inara.cz/elite/starsystem/?search=SYSTEMNAME
             # urllib.parse.quote() handles spaces, special chars, and unicode properly
             # e.g., "Sol" stays "Sol", "Alpha Centauri" becomes "Alpha%20Centauri"
-            encoded_name = urllib.parse.quote(system_name)
-            url = f"https://inara.cz/elite/starsystem/?search={encoded_name}"
-            webbrowser.open(url)
+            webbrowser.open(_INARA_SYSTEM_TMPL.format(_quote(system_name)))
         except Exception:
             logger.warning(f'!! Error opening Inara system page for {system_name}: ' + traceback.format_exc(), exc_info=False)
     
@@ -3700,9 +3916,7 @@ class GalaxyGPS():
         try:
             # EDSM system URL format: https://www.edsm.net/en/system?systemName=SYSTEMNAME
             # urllib.parse.quote() handles spaces, special chars, and unicode properly
-            encoded_name = urllib.parse.quote(system_name)
-            url = f"https://www.edsm.net/en/system?systemName={encoded_name}"
-            webbrowser.open(url)
+            webbrowser.open(_EDSM_SYSTEM_TMPL.format(_quote(system_name)))
         except Exception:
             logger.warning(f'!! Error opening EDSM system page for {system_name}: ' + traceback.format_exc(), exc_info=False)
     
@@ -3710,43 +3924,31 @@ class GalaxyGPS():
         """
         Check if the current waypoint in the route requires Tritium restock.
         Shows warning and "Find Trit" button if the current waypoint has "Restock Tritium" = "Yes".
+        Does nothing if the offset and restock value match the last call.
         """
-        if not self.fleetcarrier or not self.route:
-            self.fleetrestock_lbl.grid_remove()
-            self.find_trit_btn.grid_remove()
-            return
+        # For fleet carrier routes: [System Name, Distance, Distance Remaining, Tritium in tank, Tritium in market, Fuel Used, Icy Ring, Pristine, Restock Tritium]
+        # Restock Tritium is at index 8
+        restock_value = ""
+        if self.fleetcarrier and 0 <= self.offset < len(self.route):
+            current_waypoint = self.route[self.offset]
+            if len(current_waypoint) > 8 and current_waypoint[8]:
+                restock_value = current_waypoint[8].strip().lower()
         
-        # Check if we have a valid offset
-        if self.offset < 0 or self.offset >= len(self.route):
-            self.fleetrestock_lbl.grid_remove()
-            self.find_trit_btn.grid_remove()
+        state = (self.offset, restock_value)
+        if state == self._last_restock_state:
             return
+        self._last_restock_state = state
         
-        # Get the current waypoint from the route
-        current_waypoint = self.route[self.offset]
-        
-        logger.debug(f"[check_fleet_carrier_restock_warning] Checking waypoint at offset {self.offset}, length: {len(current_waypoint)}")
-        
-        # Check if this route entry has "Restock Tritium" = "Yes"
-        # For fleet carrier routes: [System Name, Distance, Distance Remaining, Tritium in tank, Tritium in market, Fuel Used, Icy Ring, Pristine, Restock Tritium]
-        # Restock Tritium is at index 8
-        if len(current_waypoint) > 8:
-            restock_value = current_waypoint[8].strip().lower() if current_waypoint[8] else ""
-            logger.debug(f"[check_fleet_carrier_restock_warning] Restock Tritium value at offset {self.offset}: '{restock_value}'")
-            if restock_value == "yes":
-                # Show warning
-                logger.debug(f"[check_fleet_carrier_restock_warning] Showing restock warning")
-                self.fleetrestock_lbl["text"] = plugin_tl("Restock Tritium Now")
-                self.fleetrestock_lbl.grid()
-                self.find_trit_btn.grid()
-                return
+        logger.debug("[check_fleet_carrier_restock_warning] Restock Tritium value at offset %s: '%s'", self.offset, restock_value)
+        if restock_value == "yes":
+            # Show warning
+            self.fleetrestock_lbl["text"] = plugin_tl("Restock Tritium Now")
+            self.fleetrestock_lbl.grid()
+            self.find_trit_btn.grid()
         else:
-            logger.debug(f"[check_fleet_carrier_restock_warning] Route entry length {len(current_waypoint)} <= 8")
-        
-        # Hide if no restock needed at current waypoint
-        logger.debug(f"[check_fleet_carrier_restock_warning] No restock needed, hiding warning")
-        self.fleetrestock_lbl.grid_remove()
-        self.find_trit_btn.grid_remove()
+            # Hide if no restock needed at current waypoint
+            self.fleetrestock_lbl.grid_remove()
+            self.find_trit_btn.grid_remove()
     
     def find_tritium_on_inara(self):
         """
@@ -3762,14 +3964,9 @@ class GalaxyGPS():
             
             # If no carrier selected, try to get the first/primary carrier
             if not carrier_system:
-                carriers = self.get_all_fleet_carriers()
-                if carriers:
-                    sorted_carriers = sorted(
-                        carriers,
-                        key=lambda x: x.get('last_updated', ''),
-                        reverse=True
-                    )
-                    carrier_system = sorted_carriers[0].get('current_system', '').strip()
+                carrier = _most_recent_carrier(self.get_all_fleet_carriers())
+                if carrier:
+                    carrier_system = carrier.get('current_system', '').strip()
             
             if not carrier_system:
                 # LANG: Warning when carrier system unknown
@@ -3778,9 +3975,7 @@ class GalaxyGPS():
             
             # Inara.cz commodity search URL format
             # https://inara.cz/elite/commodities/?pi2=10269&ps1=SYSTEMNAME
-            encoded_system = urllib.parse.quote(carrier_system)
-            url = f"https://inara.cz/elite/commodities/?pi2=10269&ps1={encoded_system}"
-            webbrowser.open(url)
+            webbrowser.open(_INARA_TRITIUM_TMPL.format(_quote(carrier_system)))
             
         except Exception:
             logger.warning('!! Error opening Inara Tritium search: ' + traceback.format_exc(), exc_info=False)
@@ -3796,9 +3991,6 @@ class GalaxyGPS():
             return None
         
         try:
-            import plug  # type: ignore
-            from config import config  # type: ignore
-            
             # Use the same provider as main EDMC system display
             provider = config.get_str('system_provider', default='EDSM')
             url = plug.invoke(provider, 'EDSM', 'system_url', self.current_fc_system)
@@ -3817,40 +4009,27 @@ class GalaxyGPS():
         
         try:
             # If no carrier selected, try to use the most recent one
-            callsign = self.selected_carrier_callsign
+            callsign = (self.selected_carrier_callsign or '').strip()
             
             if not callsign:
                 # No selection - try to get most recent carrier
-                carriers = self.get_all_fleet_carriers()
-                if carriers:
-                    sorted_carriers = sorted(carriers, key=lambda x: x.get('last_updated', ''), reverse=True)
-                    callsign = sorted_carriers[0].get('callsign', '') if sorted_carriers else None
-            
-            if not callsign:
-                self.current_fc_system = None
-                self.fleet_carrier_system_name['text'] = "Unknown"
-                self.fleet_carrier_system_name['url'] = None
-                return
+                carrier = _most_recent_carrier(self.get_all_fleet_carriers())
+                if carrier:
+                    callsign = (carrier.get('callsign') or '').strip()
             
             # Get carrier data directly from manager
-            if self.fleet_carrier_manager:
+            system = ''
+            if callsign and self.fleet_carrier_manager:
                 carrier = self.fleet_carrier_manager.get_carrier(callsign)
                 if carrier:
-                    system = carrier.get('current_system', '').strip()
-                    if system:
-                        # Store system name for URL generation
-                        self.current_fc_system = system
-                        # Update the hyperlink label with the system name
-                        self.fleet_carrier_system_name['text'] = system
-                        self.fleet_carrier_system_name['url'] = self.fleet_carrier_system_url
-                    else:
-                        self.current_fc_system = None
-                        self.fleet_carrier_system_name['text'] = "Unknown"
-                        self.fleet_carrier_system_name['url'] = None
-                else:
-                    self.current_fc_system = None
-                    self.fleet_carrier_system_name['text'] = "Unknown"
-                    self.fleet_carrier_system_name['url'] = None
+                    system = (carrier.get('current_system') or '').strip()
+            
+            if system:
+                # Store system name for URL generation
+                self.current_fc_system = system
+                # Update the hyperlink label with the system name
+                self.fleet_carrier_system_name['text'] = system
+                self.fleet_carrier_system_name['url'] = self.fleet_carrier_system_url
             else:
                 self.current_fc_system = None
                 self.fleet_carrier_system_name['text'] = "Unknown"
@@ -3876,30 +4055,17 @@ class GalaxyGPS():
             
             # Find the selected carrier by callsign
             carrier = None
-            if self.selected_carrier_callsign:
-                for c in carriers:
-                    if c.get('callsign', '').strip() == self.selected_carrier_callsign.strip():
-                        carrier = c
-                        break
+            selected = (self.selected_carrier_callsign or '').strip()
+            if selected:
+                carrier = self.fleet_carrier_manager.get_carrier(selected)
             
             # If no carrier selected, use the most recently updated carrier
             if not carrier:
-                try:
-                    sorted_carriers = sorted(
-                        carriers,
-                        key=lambda x: str(x.get('last_updated', '')),
-                        reverse=True
-                    )
-                    if sorted_carriers:
-                        carrier = sorted_carriers[0]
-                except (KeyError, IndexError, TypeError):
-                    # If sorting fails, just use first carrier
-                    if carriers:
-                        carrier = carriers[0]
+                carrier = _most_recent_carrier(carriers)
             
             # Get carrier's current system
             if carrier:
-                carrier_system = carrier.get('current_system', '').strip()
+                carrier_system = (carrier.get('current_system') or '').strip()
                 if not carrier_system:
                     # LANG: Warning when carrier system location unknown
                     showwarning(self.parent, plugin_tl("No System"), plugin_tl("Could not determine carrier's current system location."))
@@ -3911,40 +4077,89 @@ class GalaxyGPS():
             
             # Inara.cz commodity search URL format
             # https://inara.cz/elite/commodities/?pi2=10269&ps1=SYSTEMNAME
-            encoded_system = urllib.parse.quote(carrier_system)
-            url = f"https://inara.cz/elite/commodities/?pi2=10269&ps1={encoded_system}"
-            webbrowser.open(url)
+            webbrowser.open(_INARA_TRITIUM_TMPL.format(_quote(carrier_system)))
             
         except Exception:
             logger.warning('!! Error opening Inara Tritium search near carrier system: ' + traceback.format_exc(), exc_info=False)
             # LANG: Error opening Inara tritium search
             showerror(self.parent, plugin_tl("Error"), plugin_tl("Failed to open Inara Tritium search."))
     
+    def _get_cached_edsm_rings(self, system):
+        """Return the cached (has_icy_rings, has_pristine) for a system, or None. Called from the rings worker."""
+        with self._edsm_rings_lock:
+            if self._edsm_rings_cache is None:
+                self._edsm_rings_cache = {}
+                try:
+                    with open(self.edsm_rings_cache_path, 'r', encoding='utf-8') as cache_file:
+                        loaded = json.load(cache_file)
+                    if isinstance(loaded, dict):
+                        self._edsm_rings_cache = loaded
+                except (IOError, OSError):
+                    pass
+                except Exception:
+                    logger.warning('!! Error reading EDSM rings cache: ' + traceback.format_exc(), exc_info=False)
+            cached = self._edsm_rings_cache.get(system.lower())
+        return tuple(cached) if cached else None
+
+    def _store_edsm_rings(self, system, has_icy_rings, has_pristine):
+        """Remember a system's rings result and write the cache file through."""
+        with self._edsm_rings_lock:
+            self._edsm_rings_cache[system.lower()] = [has_icy_rings, has_pristine]
+            try:
+                with open(self.edsm_rings_cache_path, 'w', encoding='utf-8') as cache_file:
+                    json.dump(self._edsm_rings_cache, cache_file)
+            except Exception:
+                logger.warning('!! Error writing EDSM rings cache: ' + traceback.format_exc(), exc_info=False)
+
+    def _get_edsm_session(self):
+        """Return the pooled EDSM session, creating it on first use."""
+        if self._edsm_session is None:
+            session = timeout_session.new_session()
+            session.headers['User-Agent'] = user_agent + ' GalaxyGPS'
+            session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+            self._edsm_session = session
+        return self._edsm_session
+
     def _run_rings_worker(self, callsign, carrier_system, result_queue):
         """Worker: query EDSM for system bodies (icy/pristine rings) off main thread, put result in queue."""
         has_icy_rings = False
         has_pristine = False
         try:
-            encoded_system = urllib.parse.quote(carrier_system)
-            url = f"https://www.edsm.net/api-system-v1/bodies?systemName={encoded_system}"
-            session = timeout_session.new_session()
-            session.headers['User-Agent'] = user_agent + ' GalaxyGPS'
-            response = session.get(url, timeout=5)
+            # Ring types of a known system don't change, so a stored answer skips the EDSM request
+            cached = self._get_cached_edsm_rings(carrier_system)
+            if cached:
+                has_icy_rings, has_pristine = cached
+                if self.fleet_carrier_manager:
+                    self.fleet_carrier_manager.update_rings_status(callsign, has_icy_rings, has_pristine)
+                result_queue.put({'has_icy_rings': has_icy_rings, 'has_pristine': has_pristine})
+                self._notify_main_thread(RINGS_READY_EVENT)
+                return
+
+            url = _EDSM_BODIES_TMPL.format(_quote(carrier_system))
+            response = self._get_edsm_session().get(url, timeout=5)
             if response.status_code == 200:
-                system_data = response.json()
-                if 'bodies' in system_data and isinstance(system_data['bodies'], list):
-                    for body in system_data['bodies']:
-                        if 'rings' in body and isinstance(body['rings'], list):
-                            for ring in body['rings']:
-                                ring_type = ring.get('type', '').strip()
-                                reserve_level = ring.get('reserveLevel', '').strip()
-                                if ring_type.lower() == 'icy':
-                                    has_icy_rings = True
-                                    if reserve_level.lower() == 'pristine':
-                                        has_pristine = True
-                                        break
-                            if has_icy_rings and has_pristine:
-                                break
+                system_data = _json_loads(response.content)
+                bodies = system_data.get('bodies') if isinstance(system_data, dict) else None
+                if isinstance(bodies, list):
+                    for body in bodies:
+                        rings = body.get('rings')
+                        if not isinstance(rings, list):
+                            continue
+                        for ring in rings:
+                            # EDSM sends "Icy" / "Pristine"; normalise only when the exact value differs
+                            ring_type = ring.get('type', '')
+                            if ring_type == 'Icy' or ring_type.strip().lower() == 'icy':
+                                has_icy_rings = True
+                                reserve_level = ring.get('reserveLevel', '')
+                                if reserve_level == 'Pristine' or reserve_level.strip().lower() == 'pristine':
+                                    has_pristine = True
+                                    break
+                        # A pristine icy ring settles both flags
+                        if has_pristine:
+                            break
+                    # Only systems EDSM has body data for; an empty answer may fill in later
+                    if bodies:
+                        self._store_edsm_rings(carrier_system, has_icy_rings, has_pristine)
                 if self.fleet_carrier_manager:
                     self.fleet_carrier_manager.update_rings_status(callsign, has_icy_rings, has_pristine)
         except requests.RequestException as e:
@@ -3956,16 +4171,15 @@ class GalaxyGPS():
             has_icy_rings = False
             has_pristine = False
         result_queue.put({'has_icy_rings': has_icy_rings, 'has_pristine': has_pristine})
+        self._notify_main_thread(RINGS_READY_EVENT)
 
-    def _poll_rings_result(self, result_queue):
-        """Main-thread polling: when rings worker puts result, update vars and redraw toggles."""
+    def _apply_rings_result(self, event=None):
+        """Main thread: when rings worker puts result, update vars and redraw toggles."""
         if getattr(config, 'shutting_down', False):
             return
         try:
-            r = result_queue.get_nowait()
+            r = self._rings_queue.get_nowait()
         except queue.Empty:
-            if hasattr(self, 'frame') and self.frame:
-                self.frame.after(200, lambda: self._poll_rings_result(result_queue))
             return
         self.fleet_carrier_icy_rings_var.set(r['has_icy_rings'])
         self.fleet_carrier_pristine_var.set(r['has_pristine'])
@@ -3992,37 +4206,22 @@ class GalaxyGPS():
                 return
             
             carrier = None
-            callsign = None
-            if self.selected_carrier_callsign:
-                for c in carriers:
-                    if c.get('callsign', '').strip() == self.selected_carrier_callsign.strip():
-                        carrier = c
-                        callsign = c.get('callsign', '').strip()
-                        break
+            selected = (self.selected_carrier_callsign or '').strip()
+            if selected:
+                carrier = self.fleet_carrier_manager.get_carrier(selected)
             
             if not carrier:
-                try:
-                    sorted_carriers = sorted(
-                        carriers,
-                        key=lambda x: str(x.get('last_updated', '')),
-                        reverse=True
-                    )
-                    if sorted_carriers:
-                        carrier = sorted_carriers[0]
-                        callsign = carrier.get('callsign', '').strip()
-                except (KeyError, IndexError, TypeError):
-                    if carriers:
-                        carrier = carriers[0]
-                        callsign = carrier.get('callsign', '').strip()
-            
-            if not carrier or not callsign:
+                carrier = _most_recent_carrier(carriers)
+            
+            callsign = (carrier.get('callsign') or '').strip() if carrier else ''
+            if not callsign:
                 self.fleet_carrier_icy_rings_var.set(False)
                 self.fleet_carrier_pristine_var.set(False)
                 self._draw_icy_rings_toggle()
                 self._draw_pristine_toggle()
                 return
             
-            carrier_system = carrier.get('current_system', '').strip()
+            carrier_system = (carrier.get('current_system') or '').strip()
             if not carrier_system:
                 self.fleet_carrier_icy_rings_var.set(False)
                 self.fleet_carrier_pristine_var.set(False)
@@ -4030,15 +4229,15 @@ class GalaxyGPS():
                 self._draw_pristine_toggle()
                 return
             
-            icy_rings_stored = carrier.get('icy_rings', '').strip()
-            pristine_stored = carrier.get('pristine', '').strip()
+            icy_rings_stored = (carrier.get('icy_rings') or '').strip().lower()
+            pristine_stored = (carrier.get('pristine') or '').strip().lower()
             has_icy_rings = False
             has_pristine = False
             need_api_query = False
             
-            if icy_rings_stored.lower() in ['yes', 'no'] and pristine_stored.lower() in ['yes', 'no']:
-                has_icy_rings = (icy_rings_stored.lower() == 'yes')
-                has_pristine = (pristine_stored.lower() == 'yes')
+            if icy_rings_stored in _YES_NO and pristine_stored in _YES_NO:
+                has_icy_rings = (icy_rings_stored == 'yes')
+                has_pristine = (pristine_stored == 'yes')
             else:
                 need_api_query = True
                 logger.info(f"No stored rings status for carrier {callsign} in system {carrier_system}, querying API")
@@ -4046,13 +4245,12 @@ class GalaxyGPS():
             if need_api_query:
                 if not (hasattr(self, 'frame') and self.frame):
                     return
-                result_queue = queue.Queue()
+                self.frame.bind(RINGS_READY_EVENT, self._apply_rings_result)
                 threading.Thread(
                     target=self._run_rings_worker,
-                    args=(callsign, carrier_system, result_queue),
+                    args=(callsign, carrier_system, self._rings_queue),
                     daemon=True,
                 ).start()
-                self.frame.after(200, lambda: self._poll_rings_result(result_queue))
                 return
             
             self.fleet_carrier_icy_rings_var.set(has_icy_rings)
@@ -4067,6 +4265,20 @@ class GalaxyGPS():
             self._draw_icy_rings_toggle()
             self._draw_pristine_toggle()
     
+    def _set_label(self, widget, text, foreground, cursor=None):
+        """
+        Configure a label's text, foreground and (optionally) cursor, passing only the
+        options that differ from what this method last applied to it.
+        """
+        options = {'text': text, 'foreground': foreground}
+        if cursor is not None:
+            options['cursor'] = cursor
+        last = self._label_state.setdefault(widget, {})
+        changed = {key: value for key, value in options.items() if last.get(key) != value}
+        if changed:
+            widget.config(**changed)
+            last.update(changed)
+    
     def update_fleet_carrier_tritium_display(self):
         """
         Update the fleet carrier Tritium display (fuel and cargo) under the system display.
@@ -4075,35 +4287,23 @@ class GalaxyGPS():
         if not self.fleet_carrier_tritium_label:
             return
         
+        self._tritium_available = False
         try:
             # Get all carriers from CSV (same as "View All" window)
             carriers = self.get_all_fleet_carriers()
             if not carriers:
-                self.fleet_carrier_tritium_label.config(text="Tritium: Unknown", foreground="gray", cursor="")
+                self._set_label(self.fleet_carrier_tritium_label, "Tritium: Unknown", "gray", "")
                 return
             
             # Find the selected carrier by callsign
             carrier = None
-            if self.selected_carrier_callsign:
-                for c in carriers:
-                    if c.get('callsign', '').strip() == self.selected_carrier_callsign.strip():
-                        carrier = c
-                        break
+            selected = (self.selected_carrier_callsign or '').strip()
+            if selected:
+                carrier = self.fleet_carrier_manager.get_carrier(selected)
             
             # If no carrier selected, use the most recently updated carrier
             if not carrier:
-                try:
-                    sorted_carriers = sorted(
-                        carriers,
-                        key=lambda x: str(x.get('last_updated', '')),
-                        reverse=True
-                    )
-                    if sorted_carriers:
-                        carrier = sorted_carriers[0]
-                except (KeyError, IndexError, TypeError):
-                    # If sorting fails, just use first carrier
-                    if carriers:
-                        carrier = carriers[0]
+                carrier = _most_recent_carrier(carriers)
             
             # Get Tritium data from carrier (same logic as "View All" window)
             if carrier:
@@ -4115,57 +4315,54 @@ class GalaxyGPS():
                 tritium_cargo_missing = 'tritium_in_cargo' not in carrier or tritium_cargo_raw is None or (isinstance(tritium_cargo_raw, str) and tritium_cargo_raw.strip() == '')
                 
                 if fuel_missing:
-                    self.fleet_carrier_tritium_label.config(text="Tritium: Unknown", foreground="gray", cursor="")
+                    self._set_label(self.fleet_carrier_tritium_label, "Tritium: Unknown", "gray", "")
                 else:
                     # Format the display (same as "View All" window)
                     fuel = fuel_raw if fuel_raw is not None else '0'
                     tritium_cargo = tritium_cargo_raw if tritium_cargo_raw is not None else '0'
                     
+                    fuel_int = _parse_int(fuel) if fuel else 0
                     if not tritium_cargo_missing and tritium_cargo and tritium_cargo != '0':
-                        try:
-                            fuel_int = int(fuel) if fuel else 0
-                            tritium_cargo_int = int(tritium_cargo) if tritium_cargo else 0
+                        tritium_cargo_int = _parse_int(tritium_cargo)
+                        if fuel_int is not None and tritium_cargo_int is not None:
                             display_text = f"Tritium: {fuel_int} (In Cargo: {tritium_cargo_int})"
-                        except (ValueError, TypeError):
+                        else:
                             display_text = f"Tritium: {fuel} (In Cargo: {tritium_cargo})"
+                    elif fuel_int is not None:
+                        display_text = f"Tritium: {fuel_int}"
                     else:
-                        try:
-                            fuel_int = int(fuel) if fuel else 0
-                            display_text = f"Tritium: {fuel_int}"
-                        except (ValueError, TypeError):
-                            display_text = f"Tritium: {fuel}"
+                        display_text = f"Tritium: {fuel}"
                     
-                    self.fleet_carrier_tritium_label.config(text=display_text, foreground="blue", cursor="hand2")
+                    self._set_label(self.fleet_carrier_tritium_label, display_text, "blue", "hand2")
+                    self._tritium_available = True
             else:
-                self.fleet_carrier_tritium_label.config(text="Tritium: Unknown", foreground="gray", cursor="")
+                self._set_label(self.fleet_carrier_tritium_label, "Tritium: Unknown", "gray", "")
         except Exception:
-            logger.warning('!! Error updating fleet carrier Tritium display: ' + traceback.format_exc(), exc_info=False)
-            self.fleet_carrier_tritium_label.config(text="Tritium: Unknown", foreground="gray", cursor="")
+            logger.warning('!! Error updating fleet carrier Tritium display', exc_info=True)
+            self._set_label(self.fleet_carrier_tritium_label, "Tritium: Unknown", "gray", "")
     
     def _on_tritium_click(self):
         """Handle click on Tritium label - only if data is available"""
         if self.fleet_carrier_tritium_label:
-            current_fg = self.fleet_carrier_tritium_label.cget('foreground')
-            logger.debug(f"[_on_tritium_click] Current foreground color: '{current_fg}'")
-            # Allow click if foreground is blue or darkblue (data available), not gray (unknown)
-            if current_fg in ('blue', 'darkblue'):
+            # Allow click only if data is available (blue/darkblue), not unknown (gray)
+            if self._tritium_available:
                 logger.info("[_on_tritium_click] Opening tritium search on Inara")
                 self.find_tritium_near_current_system()
             else:
-                logger.debug(f"[_on_tritium_click] Click ignored - foreground is '{current_fg}', not blue/darkblue")
+                logger.debug("[_on_tritium_click] Click ignored - no Tritium data")
     
     def _on_tritium_enter(self):
         """Handle mouse enter on Tritium label - only if data is available"""
         if self.fleet_carrier_tritium_label:
-            # Only show hover effect if foreground is blue (data available), not gray (unknown)
-            if self.fleet_carrier_tritium_label.cget('foreground') == 'blue':
+            # Only show hover effect if data is available (blue), not unknown (gray)
+            if self._tritium_available:
                 self.fleet_carrier_tritium_label.config(fg="darkblue")
     
     def _on_tritium_leave(self):
         """Handle mouse leave on Tritium label - only if data is available"""
         if self.fleet_carrier_tritium_label:
-            # Only restore normal state if foreground was blue (data available), not gray (unknown)
-            if self.fleet_carrier_tritium_label.cget('foreground') in ('blue', 'darkblue'):
+            # Only restore normal state if data is available (blue/darkblue), not unknown (gray)
+            if self._tritium_available:
                 self.fleet_carrier_tritium_label.config(fg="blue")
     
     def update_fleet_carrier_balance_display(self):
@@ -4178,42 +4375,40 @@ class GalaxyGPS():
         
         try:
             # If no carrier selected, try to use the most recent one
-            callsign = self.selected_carrier_callsign
+            callsign = (self.selected_carrier_callsign or '').strip()
             
             if not callsign:
                 # No selection - try to get most recent carrier
-                carriers = self.get_all_fleet_carriers()
-                if carriers:
-                    sorted_carriers = sorted(carriers, key=lambda x: x.get('last_updated', ''), reverse=True)
-                    callsign = sorted_carriers[0].get('callsign', '') if sorted_carriers else None
+                carrier = _most_recent_carrier(self.get_all_fleet_carriers())
+                if carrier:
+                    callsign = (carrier.get('callsign') or '').strip()
             
             if not callsign:
-                self.fleet_carrier_balance_value.config(text="Unknown", foreground="gray")
+                self._set_label(self.fleet_carrier_balance_value, "Unknown", "gray")
                 return
             
             # Get carrier data directly from manager
             if self.fleet_carrier_manager:
                 carrier = self.fleet_carrier_manager.get_carrier(callsign)
                 if carrier:
-                    balance_raw = carrier.get('balance', '').strip()
+                    balance_raw = (carrier.get('balance') or '').strip()
                     if balance_raw:
-                        try:
-                            balance_int = int(balance_raw)
-                            balance_formatted = f"{balance_int:,}"
+                        balance_int = _parse_int(balance_raw)
+                        if balance_int is not None:
                             # Always green for valid balance
-                            self.fleet_carrier_balance_value.config(text=f"{balance_formatted} cr", foreground="green")
-                        except (ValueError, TypeError):
-                            self.fleet_carrier_balance_value.config(text=f"{balance_raw} cr", foreground="gray")
+                            self._set_label(self.fleet_carrier_balance_value, f"{balance_int:,} cr", "green")
+                        else:
+                            self._set_label(self.fleet_carrier_balance_value, f"{balance_raw} cr", "gray")
                     else:
-                        self.fleet_carrier_balance_value.config(text="Unknown", foreground="gray")
+                        self._set_label(self.fleet_carrier_balance_value, "Unknown", "gray")
                 else:
-                    self.fleet_carrier_balance_value.config(text="Unknown", foreground="gray")
+                    self._set_label(self.fleet_carrier_balance_value, "Unknown", "gray")
             else:
-                self.fleet_carrier_balance_value.config(text="Unknown", foreground="gray")
+                self._set_label(self.fleet_carrier_balance_value, "Unknown", "gray")
         except Exception:
-            logger.warning('!! Error updating fleet carrier balance display: ' + traceback.format_exc(), exc_info=False)
+            logger.warning('!! Error updating fleet carrier balance display', exc_info=True)
             if hasattr(self, 'fleet_carrier_balance_value') and self.fleet_carrier_balance_value:
-                self.fleet_carrier_balance_value.config(text="Unknown", foreground="gray")
+                self._set_label(self.fleet_carrier_balance_value, "Unknown", "gray")
     
     def show_route_window(self):
         """
@@ -4222,7 +4417,7 @@ class GalaxyGPS():
         Shows all columns based on route type with checkboxes for yes/no fields.
         Highlights the current next waypoint row.
         """
-        logger.info(f"[GalaxyGPS.show_route_window] Button clicked! Calling windows.show_route_window()")
+        logger.info("[GalaxyGPS.show_route_window] Button clicked! Calling windows.show_route_window()")
         try:
             show_route_window(self)
         except Exception as e:
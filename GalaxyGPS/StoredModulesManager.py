@@ -1,16 +1,52 @@
 import csv
+import functools
 import logging
 import os
-import traceback
+import re
+import sys
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from config import appname  # type: ignore
 
+from .csv_helpers import without_timestamps, write_carrier_csv
+
 # We need a name of plugin dir, not StoredModulesManager.py dir
 plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
 logger = logging.getLogger(f'{appname}.{plugin_name}')
 
+# Fleet carrier callsign pattern: XXX-XXX (alphanumeric)
+_CALLSIGN_RE = re.compile(r'([A-Z0-9]{3}-[A-Z0-9]{3})')
+
+
+def _parse_number(value: str, cast, default=None):
+    """Parse a numeric CSV cell with cast(), returning default for blank or invalid cells."""
+    try:
+        return cast(value) if value else default
+    except (ValueError, TypeError):
+        return default
+
+
+def _parse_real(value):
+    """
+    Parse a number that may be written as an int or a float, keeping that form
+    so it is written back unchanged ('1' stays 1, '0.5' becomes 0.5). Blank or invalid is None.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    parsed = _parse_number(value, int)
+    return parsed if parsed is not None else _parse_number(value, float)
+
+
+def _intern(value):
+    """Intern a string field that repeats across many modules (names, systems, engineers)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _csv_cell(value) -> str:
+    """Format a stored module value for the CSV; None is written as a blank cell."""
+    return '' if value is None else str(value)
+
 
 class StoredModulesManager:
     """
@@ -18,22 +54,25 @@ class StoredModulesManager:
     Tracks modules stored at fleet carriers (identified by StationName/MarketID).
     """
     
-    # CSV column headers
-    CSV_HEADERS = [
-        'Callsign',
-        'Storage Slot',
-        'Module Name',
-        'Module Name Localized',
-        'Buy Price',
-        'Hot',
-        'Star System',
-        'Market ID',
-        'Engineered',
-        'Engineer',
-        'Level',
-        'Quality',
-        'Last Updated'
-    ]
+    # Module dict key, CSV header and default (column absent from the file) for each column
+    _COLUMNS = (
+        ('callsign', 'Callsign', ''),
+        ('storage_slot', 'Storage Slot', ''),
+        ('module_name', 'Module Name', ''),
+        ('module_name_localized', 'Module Name Localized', ''),
+        ('buy_price', 'Buy Price', '0'),
+        ('hot', 'Hot', ''),
+        ('star_system', 'Star System', ''),
+        ('market_id', 'Market ID', ''),
+        ('engineered', 'Engineered', ''),
+        ('engineer', 'Engineer', ''),
+        ('level', 'Level', ''),
+        ('quality', 'Quality', ''),
+        ('last_updated', 'Last Updated', ''),
+    )
+    
+    # CSV column headers, in file order
+    CSV_HEADERS = [header for _key, header, _default in _COLUMNS]
     
     def __init__(self, plugin_dir: str):
         """
@@ -44,8 +83,17 @@ class StoredModulesManager:
         """
         self.plugin_dir = plugin_dir
         self.modules_file = os.path.join(plugin_dir, 'fleet_carrier_modules.csv')
-        # Keyed by callsign, value is dict of StorageSlot -> module data
+        # Keyed by callsign, value is dict of StorageSlot -> module data.
+        # buy_price/level are ints or None, quality an int or float or None, hot/engineered are bools;
+        # they are only turned into strings when the CSV is written.
         self.modules: Dict[str, Dict[str, Dict]] = {}
+        # Keyed by callsign, value is (engineered module count, total buy price);
+        # recomputed whenever a carrier's modules are replaced
+        self._totals: Dict[str, Tuple[int, int]] = {}
+        # Keyed by callsign, value is the carrier's serialized CSV rows (see _build_csv_rows)
+        self._csv_rows: Dict[str, List[List[str]]] = {}
+        # ((callsign, system, market id), Items) of the last StoredModules event that was processed
+        self._last_event: Optional[Tuple] = None
         
         # Load existing modules data
         self.load_modules()
@@ -60,76 +108,63 @@ class StoredModulesManager:
         
         try:
             with open(self.modules_file, 'r', encoding='utf-8-sig', newline='') as csvfile:
-                reader = csv.DictReader(csvfile)
+                # Positional reader: map each column to its position once from the header
+                reader = csv.reader(csvfile)
+                header = next(reader, [])
+                positions = {name: i for i, name in enumerate(header)}
+                columns = [(key, positions.get(name), default) for key, name, default in self._COLUMNS]
+                width = len(header)
                 
                 for row in reader:
-                    callsign = row.get('Callsign', '').strip()
-                    storage_slot = row.get('Storage Slot', '').strip()
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row.extend([''] * (width - len(row)))
+                    
+                    module = {key: row[i] if i is not None else default for key, i, default in columns}
+                    callsign = module['callsign'].strip()
+                    storage_slot = module['storage_slot'].strip()
                     
                     if callsign and storage_slot:
-                        if callsign not in self.modules:
-                            self.modules[callsign] = {}
-                        
-                        self.modules[callsign][storage_slot] = {
-                            'callsign': callsign,
-                            'storage_slot': storage_slot,
-                            'module_name': row.get('Module Name', ''),
-                            'module_name_localized': row.get('Module Name Localized', ''),
-                            'buy_price': row.get('Buy Price', '0'),
-                            'hot': row.get('Hot', ''),
-                            'star_system': row.get('Star System', ''),
-                            'market_id': row.get('Market ID', ''),
-                            'engineered': row.get('Engineered', ''),
-                            'engineer': row.get('Engineer', ''),
-                            'level': row.get('Level', ''),
-                            'quality': row.get('Quality', ''),
-                            'last_updated': row.get('Last Updated', '')
-                        }
+                        module['callsign'] = _intern(callsign)
+                        module['storage_slot'] = storage_slot
+                        for key in ('module_name', 'module_name_localized', 'star_system', 'engineer'):
+                            module[key] = _intern(module[key])
+                        module['buy_price'] = _parse_number(module['buy_price'], int)
+                        module['hot'] = module['hot'].lower() == 'true'
+                        module['engineered'] = module['engineered'].lower() == 'true'
+                        module['level'] = _parse_number(module['level'], int)
+                        module['quality'] = _parse_real(module['quality'])
+                        self.modules.setdefault(callsign, {})[storage_slot] = module
+            
+            for callsign in self.modules:
+                self._carrier_changed(callsign)
             
             total_modules = sum(len(mods) for mods in self.modules.values())
             logger.info(f"Loaded stored modules for {len(self.modules)} carrier(s), {total_modules} total modules")
         
         except Exception:
-            logger.warning('!! Error loading stored modules: ' + traceback.format_exc(), exc_info=False)
+            logger.warning('!! Error loading stored modules', exc_info=True)
     
     def save_modules(self) -> None:
         """
         Save stored modules data to CSV file.
         """
         try:
-            with open(self.modules_file, 'w', encoding='utf-8', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.CSV_HEADERS)
-                writer.writeheader()
-                
-                # Flatten nested dict structure for CSV output
-                for callsign in sorted(self.modules.keys()):
-                    for storage_slot in sorted(self.modules[callsign].keys(), key=lambda x: int(x) if x.isdigit() else 0):
-                        module = self.modules[callsign][storage_slot]
-                        writer.writerow({
-                            'Callsign': module.get('callsign', ''),
-                            'Storage Slot': module.get('storage_slot', ''),
-                            'Module Name': module.get('module_name', ''),
-                            'Module Name Localized': module.get('module_name_localized', ''),
-                            'Buy Price': module.get('buy_price', '0'),
-                            'Hot': module.get('hot', ''),
-                            'Star System': module.get('star_system', ''),
-                            'Market ID': module.get('market_id', ''),
-                            'Engineered': module.get('engineered', ''),
-                            'Engineer': module.get('engineer', ''),
-                            'Level': module.get('level', ''),
-                            'Quality': module.get('quality', ''),
-                            'Last Updated': module.get('last_updated', '')
-                        })
+            write_carrier_csv(self.modules_file, self.CSV_HEADERS, self.modules, self._build_csv_rows, self._csv_rows)
             
             total_modules = sum(len(mods) for mods in self.modules.values())
-            logger.debug(f"Saved stored modules for {len(self.modules)} carrier(s), {total_modules} total modules")
+            logger.debug("Saved stored modules for %d carrier(s), %d total modules", len(self.modules), total_modules)
         
         except Exception:
-            logger.warning('!! Error saving stored modules: ' + traceback.format_exc(), exc_info=False)
+            logger.warning('!! Error saving stored modules', exc_info=True)
     
-    def _extract_callsign_from_station(self, station_name: str) -> Optional[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _extract_callsign_from_station(station_name: str) -> Optional[str]:
         """
         Extract fleet carrier callsign from station name.
+        Memoized: the same few carrier station names recur in every event.
         
         Args:
             station_name: Station name (e.g., "MY CARRIER V5H-J7W")
@@ -140,14 +175,29 @@ class StoredModulesManager:
         if not station_name:
             return None
         
-        # Fleet carrier callsign pattern: XXX-XXX (alphanumeric)
-        import re
-        match = re.search(r'([A-Z0-9]{3}-[A-Z0-9]{3})', station_name.upper())
+        match = _CALLSIGN_RE.search(station_name.upper())
         if match:
             return match.group(1)
         
         return None
     
+    def _build_csv_rows(self, callsign: str) -> List[List[str]]:
+        """Return a carrier's modules as CSV rows in _COLUMNS order, sorted by numeric storage slot."""
+        carrier_modules = self.modules[callsign]
+        return [
+            [_csv_cell(carrier_modules[slot].get(key, default)) for key, _header, default in self._COLUMNS]
+            for slot in sorted(carrier_modules, key=lambda x: int(x) if x.isdigit() else 0)
+        ]
+    
+    def _carrier_changed(self, callsign: str) -> None:
+        """Refresh the cached totals and CSV rows after a carrier's modules are replaced."""
+        self._csv_rows.pop(callsign, None)
+        modules = self.modules.get(callsign, {}).values()
+        self._totals[callsign] = (
+            sum(1 for module in modules if module.get('engineered')),
+            sum(module.get('buy_price') or 0 for module in modules),
+        )
+    
     def update_from_journal_event(self, event_data: Dict, known_carriers: List[str]) -> bool:
         """
         Update stored modules from StoredModules journal event.
@@ -170,48 +220,38 @@ class StoredModulesManager:
             current_market_id = str(event_data.get('MarketID', ''))
             
             # Extract callsign from current station if it's a fleet carrier
-            current_callsign = self._extract_callsign_from_station(current_station)
+            current_callsign = StoredModulesManager._extract_callsign_from_station(current_station)
+            
+            # Only modules at the current location can be attributed to a carrier
+            # (matching a module's MarketID to some other carrier is not attempted),
+            # so nothing can match unless we are docked at a known carrier
+            if not current_callsign or current_callsign not in known_carriers:
+                return False
             
             # Process Items array
             items = event_data.get('Items', [])
             if not isinstance(items, list):
                 return False
             
-            # Group modules by location (MarketID or inferred callsign)
-            # Modules can be at different locations
-            modules_by_callsign: Dict[str, List[Dict]] = {}
+            # The game re-sends identical StoredModules events (every dock, relog); drop an
+            # exact repeat of the last processed event before building any module data
+            event = ((current_callsign, current_system, current_market_id), items)
+            if event == self._last_event:
+                return False
             
-            for item in items:
-                if not isinstance(item, dict):
-                    continue
-                
-                storage_slot = str(item.get('StorageSlot', ''))
-                if not storage_slot:
-                    continue
-                
-                # Check if module has location information
-                module_system = item.get('StarSystem', '')
-                module_market_id = str(item.get('MarketID', ''))
-                
-                # If module is at current location and it's a known carrier
-                if current_callsign and current_callsign in known_carriers:
-                    if not module_system or module_system == current_system:
-                        # Module is at current carrier
-                        if current_callsign not in modules_by_callsign:
-                            modules_by_callsign[current_callsign] = []
-                        modules_by_callsign[current_callsign].append(item)
-                        continue
-                
-                # If module has location info, try to match to a known carrier
-                # (This is tricky - we'd need to match MarketID to carrier)
-                # For now, we only process modules at the current location if it's a carrier
-                
-                # Note: Modules "in transit" won't have StarSystem/MarketID
+            # Modules at the current carrier: no StarSystem (e.g. in transit) or the current system
+            carrier_items = [
+                item for item in items
+                if isinstance(item, dict)
+                and str(item.get('StorageSlot', ''))
+                and (item.get('StarSystem') or '') in ('', current_system)
+            ]
+            modules_by_callsign: Dict[str, List[Dict]] = {current_callsign: carrier_items} if carrier_items else {}
             
             # Update modules for each carrier
             for callsign, carrier_items in modules_by_callsign.items():
-                # Clear existing modules for this carrier (replace with fresh data)
-                self.modules[callsign] = {}
+                # Build fresh data for this carrier; it replaces the existing modules if anything changed
+                carrier_modules = {}
                 
                 for item in carrier_items:
                     storage_slot = str(item.get('StorageSlot', ''))
@@ -220,24 +260,35 @@ class StoredModulesManager:
                     engineer_mods = item.get('EngineerModifications', '')
                     is_engineered = bool(engineer_mods)
                     
-                    self.modules[callsign][storage_slot] = {
-                        'callsign': callsign,
+                    carrier_modules[storage_slot] = {
+                        'callsign': _intern(callsign),
                         'storage_slot': storage_slot,
-                        'module_name': item.get('Name', ''),
-                        'module_name_localized': item.get('Name_Localised', item.get('Name', '')),
-                        'buy_price': str(item.get('BuyPrice', 0)),
-                        'hot': str(item.get('Hot', False)),
-                        'star_system': item.get('StarSystem', current_system),
-                        'market_id': item.get('MarketID', current_market_id),
-                        'engineered': str(is_engineered),
-                        'engineer': engineer_mods if is_engineered else '',
-                        'level': str(item.get('Level', '')),
-                        'quality': str(item.get('Quality', '')),
+                        'module_name': _intern(item.get('Name', '')),
+                        'module_name_localized': _intern(item.get('Name_Localised', item.get('Name', ''))),
+                        'buy_price': _parse_number(item.get('BuyPrice', 0), int, 0),
+                        'hot': bool(item.get('Hot', False)),
+                        'star_system': _intern(item.get('StarSystem', current_system)),
+                        # Stored as text, as loaded from the CSV, so the no-change check below
+                        # also matches modules loaded at startup
+                        'market_id': _csv_cell(item.get('MarketID', current_market_id)),
+                        'engineered': is_engineered,
+                        'engineer': _intern(engineer_mods) if is_engineered else '',
+                        'level': _parse_number(item.get('Level'), int),
+                        'quality': _parse_real(item.get('Quality')),
                         'last_updated': timestamp
                     }
                 
+                # StoredModules is re-sent on every dock; skip the save when only the timestamps differ
+                if without_timestamps(carrier_modules) == without_timestamps(self.modules.get(callsign, {})):
+                    logger.debug("Stored modules for carrier %s unchanged", callsign)
+                    continue
+                
+                self.modules[callsign] = carrier_modules
+                self._carrier_changed(callsign)
                 updated_carriers.add(callsign)
-                logger.info(f"Updated stored modules for carrier {callsign}: {len(self.modules[callsign])} modules")
+                logger.info("Updated stored modules for carrier %s: %d modules", callsign, len(carrier_modules))
+            
+            self._last_event = event
             
             if updated_carriers:
                 self.save_modules()
@@ -246,7 +297,7 @@ class StoredModulesManager:
             return False
         
         except Exception:
-            logger.warning('!! Error updating modules from StoredModules event: ' + traceback.format_exc(), exc_info=False)
+            logger.warning('!! Error updating modules from StoredModules event', exc_info=True)
             return False
     
     def get_modules_for_carrier(self, callsign: str) -> List[Dict]:
@@ -259,10 +310,7 @@ class StoredModulesManager:
         Returns:
             List of module dictionaries
         """
-        if callsign not in self.modules:
-            return []
-        
-        return list(self.modules[callsign].values())
+        return list(self.modules.get(callsign, {}).values())
     
     def get_module_count(self, callsign: str) -> int:
         """
@@ -274,10 +322,7 @@ class StoredModulesManager:
         Returns:
             Number of modules
         """
-        if callsign not in self.modules:
-            return 0
-        
-        return len(self.modules[callsign])
+        return len(self.modules.get(callsign, ()))
     
     def get_engineered_module_count(self, callsign: str) -> int:
         """
@@ -289,15 +334,7 @@ class StoredModulesManager:
         Returns:
             Number of engineered modules
         """
-        if callsign not in self.modules:
-            return 0
-        
-        count = 0
-        for module in self.modules[callsign].values():
-            if module.get('engineered', '').lower() == 'true':
-                count += 1
-        
-        return count
+        return self._totals.get(callsign, (0, 0))[0]
     
     def clear_modules_for_carrier(self, callsign: str) -> bool:
         """
@@ -311,6 +348,9 @@ class StoredModulesManager:
         """
         if callsign in self.modules:
             del self.modules[callsign]
+            self._totals.pop(callsign, None)
+            self._csv_rows.pop(callsign, None)
+            self._last_event = None
             self.save_modules()
             logger.info(f"Cleared stored modules for carrier {callsign}")
             return True
@@ -326,14 +366,4 @@ class StoredModulesManager:
         Returns:
             Total value as integer
         """
-        if callsign not in self.modules:
-            return 0
-        
-        total = 0
-        for module in self.modules[callsign].values():
-            try:
-                total += int(module.get('buy_price', 0))
-            except (ValueError, TypeError):
-                pass
-        
-        return total
+        return self._totals.get(callsign, (0, 0))[1]
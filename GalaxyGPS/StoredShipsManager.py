@@ -1,16 +1,25 @@
 import csv
 import logging
 import os
+import re
+import time
 import traceback
-from datetime import datetime
 from typing import Dict, List, Optional
 
 from config import appname  # type: ignore
 
+from .csv_helpers import without_timestamps, write_carrier_csv
+
 # We need a name of plugin dir, not StoredShipsManager.py dir
 plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
 logger = logging.getLogger(f'{appname}.{plugin_name}')
 
+# Fleet carrier callsign pattern: XXX-XXX (alphanumeric)
+_CALLSIGN_RE = re.compile(r'([A-Z0-9]{3}-[A-Z0-9]{3})')
+
+# Format of the 'Last Updated' column (UTC)
+_TS_FMT = '%Y-%m-%d %H:%M:%S UTC'
+
 
 class StoredShipsManager:
     """
@@ -18,17 +27,20 @@ class StoredShipsManager:
     Tracks ships stored at fleet carriers (identified by StationName/MarketID).
     """
     
-    # CSV column headers
-    CSV_HEADERS = [
-        'Callsign',
-        'Ship Type',
-        'Ship ID',
-        'Ship Name',
-        'Star System',
-        'Ship Market ID',
-        'Location Type',
-        'Last Updated'
-    ]
+    # (ship dict key, CSV column header) for each CSV column, in file order
+    _COLUMNS = (
+        ('callsign', 'Callsign'),
+        ('ship_type', 'Ship Type'),
+        ('ship_id', 'Ship ID'),
+        ('ship_name', 'Ship Name'),
+        ('star_system', 'Star System'),
+        ('ship_market_id', 'Ship Market ID'),
+        ('location_type', 'Location Type'),
+        ('last_updated', 'Last Updated'),
+    )
+    
+    # CSV column headers, in file order
+    CSV_HEADERS = [header for _key, header in _COLUMNS]
     
     def __init__(self, plugin_dir: str):
         """
@@ -41,6 +53,10 @@ class StoredShipsManager:
         self.ships_file = os.path.join(plugin_dir, 'fleet_carrier_ships.csv')
         # Keyed by callsign, value is dict of ShipID -> ship data
         self.ships: Dict[str, Dict[str, Dict]] = {}
+        # Keyed by callsign, value is the carrier's serialized CSV rows (see _build_csv_rows)
+        self._csv_rows: Dict[str, List[List[str]]] = {}
+        # Keyed by ShipID, value is the callsign of the carrier holding it (see get_ship_by_id)
+        self._ship_index: Dict[str, str] = {}
         
         # Load existing ships data
         self.load_ships()
@@ -55,26 +71,28 @@ class StoredShipsManager:
         
         try:
             with open(self.ships_file, 'r', encoding='utf-8-sig', newline='') as csvfile:
-                reader = csv.DictReader(csvfile)
+                # Positional reader: map each column to its position once from the header
+                reader = csv.reader(csvfile)
+                header = next(reader, [])
+                positions = {name: i for i, name in enumerate(header)}
+                columns = [(key, positions.get(name)) for key, name in self._COLUMNS]
+                width = len(header)
                 
                 for row in reader:
-                    callsign = row.get('Callsign', '').strip()
-                    ship_id = row.get('Ship ID', '').strip()
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row.extend([''] * (width - len(row)))
+                    
+                    ship = {key: row[i] if i is not None else '' for key, i in columns}
+                    callsign = ship['callsign'].strip()
+                    ship_id = ship['ship_id'].strip()
                     
                     if callsign and ship_id:
-                        if callsign not in self.ships:
-                            self.ships[callsign] = {}
-                        
-                        self.ships[callsign][ship_id] = {
-                            'callsign': callsign,
-                            'ship_type': row.get('Ship Type', ''),
-                            'ship_id': ship_id,
-                            'ship_name': row.get('Ship Name', ''),
-                            'star_system': row.get('Star System', ''),
-                            'ship_market_id': row.get('Ship Market ID', ''),
-                            'location_type': row.get('Location Type', ''),
-                            'last_updated': row.get('Last Updated', '')
-                        }
+                        ship['callsign'] = callsign
+                        ship['ship_id'] = ship_id
+                        self.ships.setdefault(callsign, {})[ship_id] = ship
+                        self._ship_index.setdefault(ship_id, callsign)
             
             total_ships = sum(len(ships) for ships in self.ships.values())
             logger.info(f"Loaded stored ships for {len(self.ships)} carrier(s), {total_ships} total ships")
@@ -87,24 +105,7 @@ class StoredShipsManager:
         Save stored ships data to CSV file.
         """
         try:
-            with open(self.ships_file, 'w', encoding='utf-8', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.CSV_HEADERS)
-                writer.writeheader()
-                
-                # Flatten nested dict structure for CSV output
-                for callsign in sorted(self.ships.keys()):
-                    for ship_id in sorted(self.ships[callsign].keys()):
-                        ship = self.ships[callsign][ship_id]
-                        writer.writerow({
-                            'Callsign': ship.get('callsign', ''),
-                            'Ship Type': ship.get('ship_type', ''),
-                            'Ship ID': ship.get('ship_id', ''),
-                            'Ship Name': ship.get('ship_name', ''),
-                            'Star System': ship.get('star_system', ''),
-                            'Ship Market ID': ship.get('ship_market_id', ''),
-                            'Location Type': ship.get('location_type', ''),
-                            'Last Updated': ship.get('last_updated', '')
-                        })
+            write_carrier_csv(self.ships_file, self.CSV_HEADERS, self.ships, self._build_csv_rows, self._csv_rows)
             
             total_ships = sum(len(ships) for ships in self.ships.values())
             logger.debug(f"Saved stored ships for {len(self.ships)} carrier(s), {total_ships} total ships")
@@ -112,6 +113,14 @@ class StoredShipsManager:
         except Exception:
             logger.warning('!! Error saving stored ships: ' + traceback.format_exc(), exc_info=False)
     
+    def _build_csv_rows(self, callsign: str) -> List[List[str]]:
+        """Return a carrier's ships as CSV rows in _COLUMNS order, sorted by ship ID."""
+        carrier_ships = self.ships[callsign]
+        return [
+            [carrier_ships[ship_id].get(key, '') for key, _header in self._COLUMNS]
+            for ship_id in sorted(carrier_ships)
+        ]
+    
     def _extract_callsign_from_station(self, station_name: str) -> Optional[str]:
         """
         Extract fleet carrier callsign from station name.
@@ -125,9 +134,7 @@ class StoredShipsManager:
         if not station_name:
             return None
         
-        # Fleet carrier callsign pattern: XXX-XXX (alphanumeric)
-        import re
-        match = re.search(r'([A-Z0-9]{3}-[A-Z0-9]{3})', station_name.upper())
+        match = _CALLSIGN_RE.search(station_name.upper())
         if match:
             return match.group(1)
         
@@ -146,7 +153,7 @@ class StoredShipsManager:
             True if any carrier ships were updated
         """
         try:
-            timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
+            timestamp = time.strftime(_TS_FMT, time.gmtime())
             updated = False
             
             # Get current location info from event
@@ -160,12 +167,8 @@ class StoredShipsManager:
             # Process ShipsHere (ships at current location)
             ships_here = event_data.get('ShipsHere', [])
             if isinstance(ships_here, list) and current_callsign and current_callsign in known_carriers:
-                # Clear existing ships for this carrier (we're replacing with fresh data)
-                if current_callsign in self.ships:
-                    self.ships[current_callsign] = {}
-                else:
-                    self.ships[current_callsign] = {}
-                
+                # Build the carrier's fresh ship data aside and replace it in one assignment
+                new_ships = {}
                 for ship in ships_here:
                     if not isinstance(ship, dict):
                         continue
@@ -174,7 +177,7 @@ class StoredShipsManager:
                     if not ship_id:
                         continue
                     
-                    self.ships[current_callsign][ship_id] = {
+                    new_ships[ship_id] = {
                         'callsign': current_callsign,
                         'ship_type': ship.get('ShipType', ''),
                         'ship_id': ship_id,
@@ -184,7 +187,21 @@ class StoredShipsManager:
                         'location_type': 'Here',
                         'last_updated': timestamp
                     }
-                    updated = True
+                
+                # StoredShips is re-sent on every dock; keep the stored data (and skip the save)
+                # when only the timestamps differ
+                previous_ships = self.ships.get(current_callsign)
+                if new_ships and previous_ships is not None and (
+                        without_timestamps(new_ships) == without_timestamps(previous_ships)):
+                    logger.debug("Stored ships for carrier %s unchanged", current_callsign)
+                else:
+                    self.ships[current_callsign] = new_ships
+                    self._csv_rows.pop(current_callsign, None)
+                    if previous_ships:
+                        self._unindex_ships(current_callsign, previous_ships)
+                    for ship_id in new_ships:
+                        self._ship_index[ship_id] = current_callsign
+                    updated = bool(new_ships)
             
             # Process ShipsRemote (ships stored elsewhere)
             ships_remote = event_data.get('ShipsRemote', [])
@@ -262,7 +279,9 @@ class StoredShipsManager:
             True if cleared, False if carrier not found
         """
         if callsign in self.ships:
-            del self.ships[callsign]
+            removed_ships = self.ships.pop(callsign)
+            self._csv_rows.pop(callsign, None)
+            self._unindex_ships(callsign, removed_ships)
             self.save_ships()
             logger.info(f"Cleared stored ships for carrier {callsign}")
             return True
@@ -278,8 +297,22 @@ class StoredShipsManager:
         Returns:
             Ship dictionary if found, None otherwise
         """
-        for callsign, ships in self.ships.items():
-            if ship_id in ships:
-                return ships[ship_id]
-        
-        return None
+        callsign = self._ship_index.get(ship_id)
+        if callsign is None:
+            return None
+        return self.ships[callsign][ship_id]
+    
+    def _unindex_ships(self, callsign: str, ship_ids) -> None:
+        """
+        Drop ship index entries that pointed at a carrier's removed ships.
+        Must be called after the carrier's ships have been replaced or deleted.
+        """
+        for ship_id in ship_ids:
+            if self._ship_index.get(ship_id) != callsign or ship_id in self.ships.get(callsign, ()):
+                continue
+            del self._ship_index[ship_id]
+            # Another carrier may still list this ship (e.g. it has not been re-synced yet)
+            for other_callsign, ships in self.ships.items():
+                if ship_id in ships:
+                    self._ship_index[ship_id] = other_callsign
+                    break
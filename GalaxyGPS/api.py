@@ -26,7 +26,6 @@ Stability: Stable - Breaking changes will increment major version
 import logging
 import os
 from typing import Dict, List, Optional, Any
-from copy import deepcopy
 
 from config import appname  # type: ignore
 
@@ -52,6 +51,16 @@ def _get_instance():
     return _galaxy_gps_instance
 
 
+def _copy_records(records) -> List[Dict[str, Any]]:
+    """
+    Copy a list of flat record dicts (carriers, cargo, ships) for returning to callers.
+    
+    The records only hold strings and numbers, so copying each dict is enough to
+    protect GalaxyGPS data from external modification without a full deepcopy.
+    """
+    return [dict(record) for record in records]
+
+
 def register_instance(instance):
     """
     Register the GalaxyGPS instance for API access.
@@ -148,16 +157,18 @@ def get_route_info() -> Optional[Dict[str, Any]]:
         elif instance.neutron:
             route_type = 'neutron'
         
+        # Single getattr per field instead of a hasattr probe followed by a second lookup
+        route = getattr(instance, 'route', None)
         return {
-            'next_stop': instance.next_stop if hasattr(instance, 'next_stop') else "No route planned",
-            'jumps_left': instance.jumps_left if hasattr(instance, 'jumps_left') else 0,
-            'offset': instance.offset if hasattr(instance, 'offset') else 0,
-            'total_waypoints': len(instance.route) if hasattr(instance, 'route') and instance.route else 0,
+            'next_stop': getattr(instance, 'next_stop', "No route planned"),
+            'jumps_left': getattr(instance, 'jumps_left', 0),
+            'offset': getattr(instance, 'offset', 0),
+            'total_waypoints': len(route) if route else 0,
             'route_type': route_type,
-            'is_loaded': bool(instance.route) if hasattr(instance, 'route') else False,
-            'distance_remaining': instance.dist_remaining if hasattr(instance, 'dist_remaining') else "",
-            'fuel_remaining': instance.fuel_remaining if hasattr(instance, 'fuel_remaining') else 0.0,
-            'fuel_used': instance.fuel_used if hasattr(instance, 'fuel_used') else 0.0
+            'is_loaded': bool(route),
+            'distance_remaining': getattr(instance, 'dist_remaining', ""),
+            'fuel_remaining': getattr(instance, 'fuel_remaining', 0.0),
+            'fuel_used': getattr(instance, 'fuel_used', 0.0)
         }
     except Exception as e:
         logger.error(f"[GalaxyGPS API] Error getting route info: {e}")
@@ -183,8 +194,8 @@ def get_route_waypoints() -> Optional[List[str]]:
         return None
     
     try:
-        # Return a copy to prevent external modification
-        return deepcopy(instance.route)
+        # Return a copy to prevent external modification (rows are lists of strings)
+        return [list(row) for row in instance.route]
     except Exception as e:
         logger.error(f"[GalaxyGPS API] Error getting route waypoints: {e}")
         return None
@@ -234,7 +245,7 @@ def get_route_progress() -> Optional[Dict[str, Any]]:
         return None
     
     try:
-        offset = instance.offset if hasattr(instance, 'offset') else 0
+        offset = getattr(instance, 'offset', 0)
         total = len(instance.route)
         
         current_waypoint = instance.route[offset] if 0 <= offset < total else None
@@ -263,7 +274,7 @@ def get_fleet_carriers() -> Optional[List[Dict[str, Any]]]:
     
     Returns:
         List of dictionaries containing carrier information, or None if error.
-        Returns a deep copy to prevent external modification.
+        Returns a copy to prevent external modification.
         
         Each carrier dictionary contains:
         {
@@ -297,13 +308,12 @@ def get_fleet_carriers() -> Optional[List[Dict[str, Any]]]:
         return None
     
     try:
-        carriers_dict = instance.fleet_carrier_manager.get_all_carriers()
-        if not carriers_dict:
+        carriers = instance.fleet_carrier_manager.get_all_carriers()
+        if not carriers:
             return []
         
-        # Convert dict to list and return deep copy
-        carriers_list = list(carriers_dict.values())
-        return deepcopy(carriers_list)
+        # Return copies to prevent external modification
+        return _copy_records(carriers)
     except Exception as e:
         logger.error(f"[GalaxyGPS API] Error getting fleet carriers: {e}")
         return None
@@ -319,7 +329,7 @@ def get_fleet_carrier(callsign: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dictionary containing carrier information (see get_fleet_carriers for format),
         or None if carrier not found or error.
-        Returns a deep copy to prevent external modification.
+        Returns a copy to prevent external modification.
         
     Example:
         carrier = galaxygps_api.get_fleet_carrier("ABC-123")
@@ -332,7 +342,7 @@ def get_fleet_carrier(callsign: str) -> Optional[Dict[str, Any]]:
     
     try:
         carrier = instance.fleet_carrier_manager.get_carrier(callsign)
-        return deepcopy(carrier) if carrier else None
+        return dict(carrier) if carrier else None
     except Exception as e:
         logger.error(f"[GalaxyGPS API] Error getting fleet carrier {callsign}: {e}")
         return None
@@ -345,7 +355,7 @@ def get_selected_fleet_carrier() -> Optional[Dict[str, Any]]:
     Returns:
         Dictionary containing carrier information (see get_fleet_carriers for format),
         or None if no carrier selected or error.
-        Returns a deep copy to prevent external modification.
+        Returns a copy to prevent external modification.
         
     Example:
         carrier = galaxygps_api.get_selected_fleet_carrier()
@@ -362,7 +372,7 @@ def get_selected_fleet_carrier() -> Optional[Dict[str, Any]]:
             return None
         
         carrier = instance.fleet_carrier_manager.get_carrier(callsign)
-        return deepcopy(carrier) if carrier else None
+        return dict(carrier) if carrier else None
     except Exception as e:
         logger.error(f"[GalaxyGPS API] Error getting selected fleet carrier: {e}")
         return None
@@ -377,7 +387,7 @@ def get_fleet_carrier_cargo(callsign: str) -> Optional[List[Dict[str, Any]]]:
         
     Returns:
         List of dictionaries containing cargo information, or None if error.
-        Returns a deep copy to prevent external modification.
+        Returns a copy to prevent external modification.
         
         Each cargo dictionary contains:
         {
@@ -399,7 +409,7 @@ def get_fleet_carrier_cargo(callsign: str) -> Optional[List[Dict[str, Any]]]:
     
     try:
         cargo = instance.cargo_manager.get_cargo_for_carrier(callsign)
-        return deepcopy(cargo) if cargo else []
+        return _copy_records(cargo) if cargo else []
     except Exception as e:
         logger.error(f"[GalaxyGPS API] Error getting cargo for {callsign}: {e}")
         return None
@@ -414,7 +424,7 @@ def get_fleet_carrier_ships(callsign: str) -> Optional[List[Dict[str, Any]]]:
         
     Returns:
         List of dictionaries containing ship information, or None if error.
-        Returns a deep copy to prevent external modification.
+        Returns a copy to prevent external modification.
         
         Each ship dictionary contains:
         {
@@ -435,7 +445,7 @@ def get_fleet_carrier_ships(callsign: str) -> Optional[List[Dict[str, Any]]]:
     
     try:
         ships = instance.ships_manager.get_ships_for_carrier(callsign)
-        return deepcopy(ships) if ships else []
+        return _copy_records(ships) if ships else []
     except Exception as e:
         logger.error(f"[GalaxyGPS API] Error getting ships for {callsign}: {e}")
         return None
@@ -0,0 +1,33 @@
+import csv
+import os
+from typing import Callable, Dict, Iterable, List
+
+
+def without_timestamps(items: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Return a carrier's stored items with 'last_updated' dropped, for change detection."""
+    return {
+        item_id: {key: value for key, value in item.items() if key != 'last_updated'}
+        for item_id, item in items.items()
+    }
+
+
+def write_carrier_csv(path: str, headers: List[str], callsigns: Iterable[str],
+                      build_rows: Callable[[str], List[List[str]]],
+                      row_cache: Dict[str, List[List[str]]]) -> None:
+    """
+    Write per-carrier CSV rows to path, carriers sorted by callsign.
+
+    Rows come from row_cache, falling back to build_rows(callsign) for carriers not
+    cached yet; callers drop a carrier's cache entry when its data changes. The file is
+    written to a temporary path and swapped in, so a failed save keeps the previous CSV.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(headers)
+        for callsign in sorted(callsigns):
+            rows = row_cache.get(callsign)
+            if rows is None:
+                rows = row_cache[callsign] = build_rows(callsign)
+            writer.writerows(rows)
+    os.replace(tmp_path, path)
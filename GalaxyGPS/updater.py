@@ -7,6 +7,12 @@ import zipfile
 from config import appname, user_agent  # type: ignore
 import timeout_session  # type: ignore
 
+try:
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # We need a name of plugin dir, not GalaxyGPS.py dir
 plugin_name = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
 logger = logging.getLogger(f'{appname}.{plugin_name}')
@@ -74,7 +80,7 @@ class SpanshUpdater():
             r = session.get(url, timeout=2)
             if r.status_code == 200:
                 # Get the changelog and replace all breaklines with simple ones
-                changelogs = json.loads(r.content)["body"]
+                changelogs = _json_loads(r.content)["body"]
                 changelogs = "\n".join(changelogs.splitlines())
                 return changelogs
 
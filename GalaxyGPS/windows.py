@@ -5,6 +5,7 @@ import os
 import traceback
 from typing import Dict, List, Tuple
 from collections import defaultdict
+from operator import itemgetter
 
 import tkinter as tk
 import tkinter.font as tkfont
@@ -486,7 +487,8 @@ def show_carrier_details_window(plugin, skip_refresh_check=False):
             base_row_bg = ""  # Empty string allows theme to handle it
             alt_row_bg = ""
         
-        for idx, carrier in enumerate(sorted(carriers, key=lambda x: x.get('last_updated', ''), reverse=True)):
+        # FleetCarrierManager always sets last_updated, so the C itemgetter can replace a lambda
+        for idx, carrier in enumerate(sorted(carriers, key=itemgetter('last_updated'), reverse=True)):
             data_row = idx + 1  # Start from row 1 (row 0 is header)
             
             # Alternate row background color for better readability
@@ -1294,7 +1296,7 @@ def show_route_window(plugin, skip_refresh_check=False):
         plugin: The plugin instance
         skip_refresh_check: If True, skip the check for existing window (used by refresh function)
     """
-    logger.info(f"[show_route_window] CALLED - route length: {len(plugin.route) if plugin.route else 0}")
+    logger.info("[show_route_window] CALLED - route length: %d", len(plugin.route) if plugin.route else 0)
     try:
         if not plugin.route or len(plugin.route) == 0:
             logger.info("[show_route_window] No route loaded, showing info dialog")
@@ -1331,10 +1333,10 @@ def show_route_window(plugin, skip_refresh_check=False):
         fieldnames = []
         fieldname_map = {}
 
-        logger.debug(f"[show_route_window] route_full_data length: {len(plugin.route_full_data) if plugin.route_full_data else 0}")
-        logger.debug(f"[show_route_window] route_fieldnames: {plugin.route_fieldnames if hasattr(plugin, 'route_fieldnames') else 'N/A'}")
-        if plugin.route_full_data and len(plugin.route_full_data) > 0:
-            logger.debug(f"[show_route_window] First row keys: {list(plugin.route_full_data[0].keys())}")
+        logger.debug("[show_route_window] route_full_data length: %d", len(plugin.route_full_data) if plugin.route_full_data else 0)
+        logger.debug("[show_route_window] route_fieldnames: %s", getattr(plugin, 'route_fieldnames', 'N/A'))
+        if plugin.route_full_data and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[show_route_window] First row keys: %s", list(plugin.route_full_data[0].keys()))
         
         if plugin.route_full_data and len(plugin.route_full_data) > 0:
             # Use in-memory full data (preserves all columns from original CSV)
@@ -1343,12 +1345,12 @@ def show_route_window(plugin, skip_refresh_check=False):
             if plugin.route_fieldnames:
                 fieldnames = plugin.route_fieldnames
                 fieldname_map = {name.lower(): name for name in fieldnames}
-                logger.debug(f"[show_route_window] Using route_fieldnames: {fieldnames}")
+                logger.debug("[show_route_window] Using route_fieldnames: %s", fieldnames)
             elif route_data:
                 # Fallback: extract from first row keys (will be lowercase)
                 fieldnames = list(route_data[0].keys())
                 fieldname_map = {name.lower(): name for name in fieldnames}
-                logger.debug(f"[show_route_window] Using keys from first row: {fieldnames}")
+                logger.debug("[show_route_window] Using keys from first row: %s", fieldnames)
         elif os.path.exists(plugin.save_route_path):
             # Fallback: read from saved CSV file
             try:
@@ -1454,7 +1456,7 @@ def show_route_window(plugin, skip_refresh_check=False):
         # Use original fieldnames if available
         display_columns = []  # For display (translated)
         data_columns = []  # For data lookup (original English names)
-        logger.debug(f"[show_route_window] Building display columns, fieldnames length: {len(fieldnames)}")
+        logger.debug("[show_route_window] Building display columns, fieldnames length: %d", len(fieldnames))
         
         # Create a translation mapping for common column headers
         def translate_column_header(header):
@@ -1491,14 +1493,14 @@ def show_route_window(plugin, skip_refresh_check=False):
                 field_lower = field.lower()
                 # Always exclude excluded columns
                 if field_lower in exclude_columns:
-                    logger.debug(f"[show_route_window] Excluding column: {field}")
+                    logger.debug("[show_route_window] Excluding column: %s", field)
                     continue
                 # Keep original field for data lookup
                 data_columns.append(field)
                 # Translate the header for display only
                 translated_field = translate_column_header(field)
                 display_columns.append(translated_field)
-            logger.debug(f"[show_route_window] Display columns from fieldnames: {display_columns}")
+            logger.debug("[show_route_window] Display columns from fieldnames: %s", display_columns)
         elif route_data and len(route_data) > 0:
             # Fallback: use keys from first route entry (convert back to title case if possible)
             for key in route_data[0].keys():
@@ -1510,7 +1512,7 @@ def show_route_window(plugin, skip_refresh_check=False):
                     # Translate the header for display only
                     translated_display_name = translate_column_header(display_name)
                     display_columns.append(translated_display_name)
-            logger.debug(f"[show_route_window] Display columns from keys: {display_columns}")
+            logger.debug("[show_route_window] Display columns from keys: %s", display_columns)
 
         # For Road to Riches, track previous system name to avoid repetition
         prev_system_name = None
@@ -3240,9 +3242,11 @@ def _extract_module_info(module: Dict) -> Dict:
         price = 0
     
     # Get engineering info
-    is_engineered = module.get('engineered', '').lower() == 'true'
+    is_engineered = bool(module.get('engineered'))
     engineer_mod = module.get('engineer', '')
-    level = module.get('level', '')
+    level = module.get('level')
+    if level is None:
+        level = ''
     
     # Format engineering display
     engineering_text = ""
@@ -3426,7 +3430,7 @@ def show_modules_details_window(plugin, callsign: str):
             engineered_in_cat = sum(
                 1 for mods in subcategories.values()
                 for mod in mods
-                if mod.get('engineered', '').lower() == 'true'
+                if mod.get('engineered')
             )
             
             # Create container for this category
@@ -194,9 +194,9 @@ def journal_entry(cmdr, is_beta, system, station, entry, state):
                 if hasattr(galaxy_gps, 'update_fleet_carrier_rings_status'):
                     galaxy_gps.update_fleet_carrier_rings_status()
                 if hasattr(galaxy_gps, 'update_fleet_carrier_tritium_display'):
-                    galaxy_gps.update_fleet_carrier_tritium_display()
+                    galaxy_gps._schedule_refresh('tritium', galaxy_gps.update_fleet_carrier_tritium_display)
                 if hasattr(galaxy_gps, 'update_fleet_carrier_balance_display'):
-                    galaxy_gps.update_fleet_carrier_balance_display()
+                    galaxy_gps._schedule_refresh('balance', galaxy_gps.update_fleet_carrier_balance_display)
                 if hasattr(galaxy_gps, 'check_fleet_carrier_restock_warning'):
                     galaxy_gps.check_fleet_carrier_restock_warning()
         
@@ -225,9 +225,9 @@ def journal_entry(cmdr, is_beta, system, station, entry, state):
                 if hasattr(galaxy_gps, 'update_fleet_carrier_rings_status'):
                     galaxy_gps.update_fleet_carrier_rings_status()
                 if hasattr(galaxy_gps, 'update_fleet_carrier_tritium_display'):
-                    galaxy_gps.update_fleet_carrier_tritium_display()
+                    galaxy_gps._schedule_refresh('tritium', galaxy_gps.update_fleet_carrier_tritium_display)
                 if hasattr(galaxy_gps, 'update_fleet_carrier_balance_display'):
-                    galaxy_gps.update_fleet_carrier_balance_display()
+                    galaxy_gps._schedule_refresh('balance', galaxy_gps.update_fleet_carrier_balance_display)
         
         elif event_name == 'Location' and is_at_carrier and entry.get('Docked'):
             # Location event when docked at carrier - update location if carrier moved
@@ -258,9 +258,9 @@ def journal_entry(cmdr, is_beta, system, station, entry, state):
                             if hasattr(galaxy_gps, 'update_fleet_carrier_rings_status'):
                                 galaxy_gps.update_fleet_carrier_rings_status()
                             if hasattr(galaxy_gps, 'update_fleet_carrier_tritium_display'):
-                                galaxy_gps.update_fleet_carrier_tritium_display()
+                                galaxy_gps._schedule_refresh('tritium', galaxy_gps.update_fleet_carrier_tritium_display)
                             if hasattr(galaxy_gps, 'update_fleet_carrier_balance_display'):
-                                galaxy_gps.update_fleet_carrier_balance_display()
+                                galaxy_gps._schedule_refresh('balance', galaxy_gps.update_fleet_carrier_balance_display)
                             if hasattr(galaxy_gps, 'check_fleet_carrier_restock_warning'):
                                 galaxy_gps.check_fleet_carrier_restock_warning()
 
@@ -455,11 +455,11 @@ def capi_fleetcarrier(data):
         
         # Update fleet carrier Tritium display
         if hasattr(galaxy_gps, 'update_fleet_carrier_tritium_display'):
-            galaxy_gps.update_fleet_carrier_tritium_display()
+            galaxy_gps._schedule_refresh('tritium', galaxy_gps.update_fleet_carrier_tritium_display)
         
         # Update fleet carrier balance display
         if hasattr(galaxy_gps, 'update_fleet_carrier_balance_display'):
-            galaxy_gps.update_fleet_carrier_balance_display()
+            galaxy_gps._schedule_refresh('balance', galaxy_gps.update_fleet_carrier_balance_display)
         
         # Update fleet carrier restock warning
         if hasattr(galaxy_gps, 'check_fleet_carrier_restock_warning'):